@@ -173,6 +173,10 @@ class DataverseClient:
         self._check_closed()
         if self._session is None:
             self._session = requests.Session()
+        # An OData client created before entering (e.g. by an earlier call) keeps its
+        # caches; attach the session so it pools connections too.
+        if self._odata is not None and self._odata._http._session is None:
+            self._odata._http._session = self._session
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
@@ -224,9 +228,10 @@ class DataverseClient:
         :param kind: Cache kind to flush. Currently supported values:
 
             - ``"picklist"``: Clears picklist label cache used for label-to-integer conversion
+            - ``"entityset"``: Clears cached entity set names, primary id attributes and
+              recent "table not found" lookups, e.g. after another process created a table
 
-            Future kinds (e.g. ``"entityset"``, ``"primaryid"``) may be added without
-            breaking this signature.
+            Future kinds may be added without breaking this signature.
         :type kind: :class:`str`
 
         :return: Number of cache entries removed.
@@ -81,16 +81,21 @@ class _HttpClient:
                 m = (method or "").lower()
                 kwargs["timeout"] = 120 if m in ("post", "delete") else 10
 
+        logger = self._logger
+        # Request/response records are DEBUG-level; when the logger filters DEBUG out, skip
+        # building them (and decoding response bodies) altogether. Errors are still logged.
+        trace_logger = logger if logger is not None and logger.debug_enabled else None
+
         # Log outbound request once (before retry loop).
         # Use explicit key presence checks so falsy values (e.g. {}) are logged correctly.
-        if self._logger is not None:
+        if trace_logger is not None:
             if "json" in kwargs:
                 req_body = kwargs["json"]
             elif "data" in kwargs:
                 req_body = kwargs["data"]
             else:
                 req_body = None
-            self._logger.log_request(
+            trace_logger.log_request(
                 method,
                 url,
                 headers=kwargs.get("headers"),
@@ -100,27 +105,13 @@ class _HttpClient:
         # Small backoff retry on network errors only
         requester = self._session.request if self._session is not None else requests.request
         for attempt in range(self.max_attempts):
+            # Diagnostics are off by default; skip the clock read entirely in that case.
+            t0 = time.perf_counter_ns() if trace_logger is not None else 0
             try:
-                t0 = time.monotonic()
                 resp = requester(method, url, **kwargs)
-                elapsed_ms = (time.monotonic() - t0) * 1000
-
-                if self._logger is not None:
-                    # Only decode resp.text when body logging is enabled — avoids
-                    # unnecessary overhead for large payloads when max_body_bytes == 0.
-                    resp_body = resp.text if self._logger.body_logging_enabled else None
-                    self._logger.log_response(
-                        method,
-                        url,
-                        status_code=resp.status_code,
-                        headers=dict(resp.headers),
-                        body=resp_body,
-                        elapsed_ms=elapsed_ms,
-                    )
-                return resp
             except requests.exceptions.RequestException as exc:
-                if self._logger is not None:
-                    self._logger.log_error(
+                if logger is not None:
+                    logger.log_error(
                         method,
                         url,
                         exc,
@@ -133,6 +124,22 @@ class _HttpClient:
                 time.sleep(delay)
                 continue
 
+            # Success path stays outside the try so only transport errors are retried.
+            if trace_logger is not None:
+                elapsed_ms = (time.perf_counter_ns() - t0) / 1_000_000
+                # Only decode resp.text when body logging is enabled — avoids
+                # unnecessary overhead for large payloads when max_body_bytes == 0.
+                resp_body = resp.text if trace_logger.body_logging_enabled else None
+                trace_logger.log_response(
+                    method,
+                    url,
+                    status_code=resp.status_code,
+                    headers=dict(resp.headers),
+                    body=resp_body,
+                    elapsed_ms=elapsed_ms,
+                )
+            return resp
+
     def close(self) -> None:
         """Close the HTTP client and release resources.
 
@@ -80,6 +80,9 @@ class _HttpLogger:
         body: Any = None,
     ) -> None:
         """Log an outbound HTTP request."""
+        # Request/response records are DEBUG; skip redaction and body formatting when filtered out.
+        if not self.debug_enabled:
+            return
         safe_headers = self._redact_headers(headers or {})
         body_text = self._truncate_body(body)
         lines = [f">>> REQUEST  {method.upper()} {url}"]
@@ -98,6 +101,8 @@ class _HttpLogger:
         elapsed_ms: Optional[float] = None,
     ) -> None:
         """Log an inbound HTTP response."""
+        if not self.debug_enabled:
+            return
         safe_headers = self._redact_headers(headers or {})
         body_text = self._truncate_body(body)
         elapsed_str = f" ({elapsed_ms:.1f}ms)" if elapsed_ms is not None else ""
@@ -130,6 +135,11 @@ class _HttpLogger:
         attempt_str = f" [attempt {attempt}/{max_attempts}]" if attempt is not None and max_attempts is not None else ""
         self._logger.error(f"!!! ERROR    {method.upper()} {url}{attempt_str} - {type(error).__name__}: {error}")
 
+    @property
+    def debug_enabled(self) -> bool:
+        """Return True if request/response records (DEBUG level) would be emitted."""
+        return self._logger.isEnabledFor(logging.DEBUG)
+
     @property
     def body_logging_enabled(self) -> bool:
         """Return True if body capture is enabled (max_body_bytes > 0)."""
@@ -145,7 +155,8 @@ class _HttpLogger:
         return {k: ("[REDACTED]" if k.lower() in self._redacted else v) for k, v in headers.items()}
 
     def _truncate_body(self, body: Any) -> str:
-        if body is None:
+        limit = self._config.max_body_bytes
+        if body is None or limit == 0:
             return ""
         if isinstance(body, (bytes, bytearray)):
             text = body.decode("utf-8", errors="replace")
@@ -157,9 +168,6 @@ class _HttpLogger:
         else:
             text = body
 
-        limit = self._config.max_body_bytes
-        if limit == 0:
-            return ""
         encoded = text.encode("utf-8")
         if len(encoded) > limit:
             # Truncate on byte boundary, then decode safely to avoid splitting
@@ -48,6 +48,9 @@ if TYPE_CHECKING:
 
 __all__ = []
 
+# Intents that address records of a table by entity set
+_RECORD_INTENTS = (_RecordCreate, _RecordUpdate, _RecordDelete, _RecordGet, _RecordList, _RecordUpsert)
+
 
 # ---------------------------------------------------------------------------
 # Batch client: resolves intents → raw requests → multipart body → HTTP → result
@@ -80,6 +83,7 @@ class _BatchClient(_BatchBase):
         if not items:
             return BatchResult()
 
+        self._prefetch_record_tables(items)
         resolved = self._resolve_all(items)
 
         total = sum(len(r.requests) if isinstance(r, _ChangeSetBatchItem) else 1 for r in resolved)
@@ -112,12 +116,29 @@ class _BatchClient(_BatchBase):
             # _raise_top_level_batch_error rather than letting _request raise.
             expected=(200, 202, 207, 400),
         )
-        return self._parse_batch_response(response)
+        result = self._parse_batch_response(response)
+        self._forget_entity_set_misses(items)
+        return result
 
     # ------------------------------------------------------------------
     # Intent resolution dispatcher
     # ------------------------------------------------------------------
 
+    def _prefetch_record_tables(self, items: List[Any]) -> None:
+        """Resolve entity sets for every table the record operations touch before resolving them.
+
+        A batch spanning several tables then costs one metadata request per
+        chunk of tables instead of one lookup per table during resolution.
+        """
+        tables = [
+            op.table
+            for item in items
+            for op in (item.operations if isinstance(item, _ChangeSet) else (item,))
+            if isinstance(op, _RECORD_INTENTS)
+        ]
+        if len({self._od._normalize_cache_key(table) for table in tables}) > 1:
+            self._od._prefetch_entity_metadata(tables)
+
     def _resolve_all(self, items: List[Any]) -> List[Union[_RawRequest, _ChangeSetBatchItem]]:
         result: List[Union[_RawRequest, _ChangeSetBatchItem]] = []
         for item in items:
@@ -295,6 +295,17 @@ class _BatchBase:
         body["Lookup"] = lookup.to_dict()
         return [self._od._build_create_relationship(body, solution=op.solution)]
 
+    def _forget_entity_set_misses(self, items: List[Any]) -> None:
+        """Drop cached "table not found" lookups for every table created by ``items``.
+
+        Batch table creates never go through ``_create_entity``, so without this a
+        lookup that failed before the batch keeps failing until the miss expires.
+        """
+        for item in items:
+            for op in item.operations if isinstance(item, _ChangeSet) else (item,):
+                if isinstance(op, _TableCreate):
+                    self._od._entityset_miss_cache.pop(self._od._normalize_cache_key(op.table), None)
+
     # ------------------------------------------------------------------
     # Multipart serialisation
     # ------------------------------------------------------------------
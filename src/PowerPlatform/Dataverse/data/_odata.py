@@ -47,6 +47,14 @@ from ._odata_base import (
     _RequestContext,
 )
 
+# Sleep before each metadata retry on 404 (eventual consistency after create);
+# one more attempt is made than there are delays.
+_METADATA_BACKOFF: tuple[float, ...] = (0.4, 0.8, 1.6, 3.2)
+# Tables per EntityDefinitions request when prefetching; keeps the OR-ed $filter well under URL limits
+_ENTITY_PREFETCH_CHUNK_SIZE = 50
+# Entity definition properties the client reads back from metadata lookups and table creation
+_ENTITY_DEFINITION_SELECT = "MetadataId,LogicalName,SchemaName,EntitySetName,PrimaryNameAttribute,PrimaryIdAttribute"
+
 
 class _ODataClient(_FileUploadMixin, _RelationshipOperationsMixin, _ODataBase):
     """Dataverse Web API client: CRUD, SQL-over-API, and table metadata helpers."""
@@ -81,6 +89,19 @@ class _ODataClient(_FileUploadMixin, _RelationshipOperationsMixin, _ODataBase):
             session=session,
             logger=self._http_logger,
         )
+        # Everything except the bearer token is fixed for the client's lifetime;
+        # build it once so _headers() only has to splice in the current token.
+        self._token_scope = f"{self.base_url}/.default"
+        ua = _USER_AGENT
+        if self._operation_context:
+            ua = f"{_USER_AGENT} ({self._operation_context})"
+        self._static_headers: Dict[str, str] = {
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+            "OData-MaxVersion": "4.0",
+            "OData-Version": "4.0",
+            "User-Agent": ua,
+        }
 
     def close(self) -> None:
         """Close the OData client and release resources.
@@ -94,27 +115,17 @@ class _ODataClient(_FileUploadMixin, _RelationshipOperationsMixin, _ODataBase):
 
     def _headers(self) -> Dict[str, str]:
         """Build standard OData headers with bearer auth."""
-        scope = f"{self.base_url}/.default"
-        token = self.auth._acquire_token(scope).access_token
-        ua = _USER_AGENT
-        if self._operation_context:
-            ua = f"{_USER_AGENT} ({self._operation_context})"
-        return {
-            "Authorization": f"Bearer {token}",
-            "Accept": "application/json",
-            "Content-Type": "application/json",
-            "OData-MaxVersion": "4.0",
-            "OData-Version": "4.0",
-            "User-Agent": ua,
-        }
+        token = self.auth._acquire_token(self._token_scope).access_token
+        headers = {"Authorization": f"Bearer {token}"}
+        headers.update(self._static_headers)
+        return headers
 
     def _merge_headers(self, headers: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+        # _headers() returns a fresh dict on every call, so it can be updated in place.
         base = self._headers()
-        if not headers:
-            return base
-        merged = base.copy()
-        merged.update(headers)
-        return merged
+        if headers:
+            base.update(headers)
+        return base
 
     def _raw_request(self, method: str, url: str, **kwargs):
         return self._http._request(method, url, **kwargs)
@@ -341,21 +352,23 @@ class _ODataClient(_FileUploadMixin, _RelationshipOperationsMixin, _ODataBase):
             raise ValueError(
                 f"alternate_keys and records must have the same length " f"({len(alternate_keys)} != {len(records)})"
             )
-        logical_name = table_schema_name.lower()
+        odata_type = f"Microsoft.Dynamics.CRM.{table_schema_name.lower()}"
+        # Bound once: the loop runs per record for batches of thousands
+        lowercase_keys = self._lowercase_keys
+        convert_labels = self._convert_labels_to_ints
+        build_key = self._build_alternate_key_str
         targets: List[Dict[str, Any]] = []
         for alt_key, record in zip(alternate_keys, records):
-            alt_key_lower = self._lowercase_keys(alt_key)
-            record_processed = self._lowercase_keys(record)
-            record_processed = self._convert_labels_to_ints(table_schema_name, record_processed)
+            alt_key_lower = lowercase_keys(alt_key)
+            record_processed = convert_labels(table_schema_name, lowercase_keys(record))
             conflicting = {
-                k for k in set(alt_key_lower) & set(record_processed) if alt_key_lower[k] != record_processed[k]
+                k for k in alt_key_lower.keys() & record_processed.keys() if alt_key_lower[k] != record_processed[k]
             }
             if conflicting:
                 raise ValueError(f"record payload conflicts with alternate_key on fields: {sorted(conflicting)!r}")
             if "@odata.type" not in record_processed:
-                record_processed["@odata.type"] = f"Microsoft.Dynamics.CRM.{logical_name}"
-            key_str = self._build_alternate_key_str(alt_key)
-            record_processed["@odata.id"] = f"{entity_set}({key_str})"
+                record_processed["@odata.type"] = odata_type
+            record_processed["@odata.id"] = f"{entity_set}({build_key(alt_key)})"
             targets.append(record_processed)
         payload = {"Targets": targets}
         url = f"{self.api}/{entity_set}/Microsoft.Dynamics.CRM.UpsertMultiple"
@@ -368,6 +381,9 @@ class _ODataClient(_FileUploadMixin, _RelationshipOperationsMixin, _ODataBase):
         pid = self._logical_primaryid_cache.get(cache_key)
         if pid:
             return pid
+        # The entity set and primary id caches evict independently, so a cached entity set does not
+        # imply a cached primary id; drop it to force a metadata fetch that repopulates both.
+        self._logical_to_entityset_cache.pop(cache_key, None)
         # Resolve metadata (populates _logical_primaryid_cache or raises if table_schema_name unknown)
         self._entity_set_from_schema_name(table_schema_name)
         pid2 = self._logical_primaryid_cache.get(cache_key)
@@ -396,8 +412,9 @@ class _ODataClient(_FileUploadMixin, _RelationshipOperationsMixin, _ODataBase):
             raise TypeError("ids must be list[str]")
         if not ids:
             return None
-        pk_attr = self._primary_id_attr(table_schema_name)
+        # Resolving the entity set also caches the primary id, so the pk lookup is a single cache hit
         entity_set = self._entity_set_from_schema_name(table_schema_name)
+        pk_attr = self._primary_id_attr(table_schema_name)
         if isinstance(changes, dict):
             batch = [{pk_attr: rid, **changes} for rid in ids]
             self._update_multiple(entity_set, table_schema_name, batch)
@@ -748,31 +765,16 @@ class _ODataClient(_FileUploadMixin, _RelationshipOperationsMixin, _ODataBase):
         cached = self._logical_to_entityset_cache.get(cache_key)
         if cached:
             return cached
-        url = f"{self.api}/EntityDefinitions"
-        # LogicalName in Dataverse is stored in lowercase, so we need to lowercase for the filter
-        logical_lower = table_schema_name.lower()
-        logical_escaped = self._escape_odata_quotes(logical_lower)
-        params = {
-            "$select": "LogicalName,EntitySetName,PrimaryIdAttribute",
-            "$filter": f"LogicalName eq '{logical_escaped}'",
-        }
-        r = self._request("get", url, params=params)
-        try:
-            body = r.json()
-            items = body.get("value", []) if isinstance(body, dict) else []
-        except ValueError:
-            items = []
-        if not items:
-            plural_hint = (
-                " (did you pass a plural entity set name instead of the singular table schema name?)"
-                if table_schema_name.endswith("s") and not table_schema_name.endswith("ss")
-                else ""
-            )
-            raise MetadataError(
-                f"Unable to resolve entity set for table schema name '{table_schema_name}'. Provide the singular table schema name.{plural_hint}",
-                subcode=METADATA_ENTITYSET_NOT_FOUND,
-            )
-        md = items[0]
+        # Recently confirmed missing: fail fast instead of repeating the lookup
+        missed_at = self._entityset_miss_cache.get(cache_key)
+        if missed_at is not None and (time.time() - missed_at) < self._entityset_miss_ttl_seconds:
+            raise self._entity_set_not_found(table_schema_name)
+        # LogicalName in Dataverse is stored in lowercase, which is exactly the normalized cache key
+        md = self._get_entity_definition(cache_key, {"$select": "LogicalName,EntitySetName,PrimaryIdAttribute"})
+        if md is None:
+            self._entityset_miss_cache[cache_key] = time.time()
+            raise self._entity_set_not_found(table_schema_name)
+        self._entityset_miss_cache.pop(cache_key, None)
         es = md.get("EntitySetName")
         if not es:
             raise MetadataError(
@@ -785,7 +787,101 @@ class _ODataClient(_FileUploadMixin, _RelationshipOperationsMixin, _ODataBase):
             self._logical_primaryid_cache[cache_key] = primary_id_attr
         return es
 
+    def _prefetch_entity_metadata(self, table_schema_names: Iterable[str]) -> None:
+        """Resolve entity set and primary id for several tables in batched metadata requests.
+
+        Names are requested ``_ENTITY_PREFETCH_CHUNK_SIZE`` at a time, one
+        ``EntityDefinitions`` request per chunk.
+
+        Populates the same caches as :meth:`_entity_set_from_schema_name` for every
+        name not already cached, so later per-table lookups are cache hits. Names
+        that do not match a table are skipped here and raise on first real use.
+
+        :param table_schema_names: Schema (or logical) names of the tables to resolve.
+        :type table_schema_names: ``Iterable[str]``
+        """
+        pending = [
+            key
+            for key in dict.fromkeys(self._normalize_cache_key(name) for name in table_schema_names)
+            if key and key not in self._logical_to_entityset_cache
+        ]
+        for start in range(0, len(pending), _ENTITY_PREFETCH_CHUNK_SIZE):
+            self._prefetch_entity_metadata_chunk(pending[start : start + _ENTITY_PREFETCH_CHUNK_SIZE])
+
+    def _prefetch_entity_metadata_chunk(self, keys: List[str]) -> None:
+        """Resolve one bounded chunk of normalized table names for :meth:`_prefetch_entity_metadata`."""
+        params = {
+            "$select": "LogicalName,EntitySetName,PrimaryIdAttribute",
+            "$filter": " or ".join(f"LogicalName eq '{self._escape_odata_quotes(key)}'" for key in keys),
+        }
+        r = self._request("get", self._entity_definitions_url, params=params)
+        try:
+            body = r.json()
+        except ValueError:
+            return
+        items = body.get("value") if isinstance(body, dict) else None
+        if not isinstance(items, list):
+            return
+        for md in items:
+            if not isinstance(md, dict):
+                continue
+            logical_name = md.get("LogicalName")
+            es = md.get("EntitySetName")
+            if not isinstance(logical_name, str) or not es:
+                continue
+            cache_key = self._normalize_cache_key(logical_name)
+            self._logical_to_entityset_cache[cache_key] = es
+            self._entityset_miss_cache.pop(cache_key, None)
+            primary_id_attr = md.get("PrimaryIdAttribute")
+            if isinstance(primary_id_attr, str) and primary_id_attr:
+                self._logical_primaryid_cache[cache_key] = primary_id_attr
+
+    @staticmethod
+    def _entity_set_not_found(table_schema_name: str) -> MetadataError:
+        """Build the error raised when no entity set matches ``table_schema_name``."""
+        plural_hint = (
+            " (did you pass a plural entity set name instead of the singular table schema name?)"
+            if table_schema_name.endswith("s") and not table_schema_name.endswith("ss")
+            else ""
+        )
+        return MetadataError(
+            f"Unable to resolve entity set for table schema name '{table_schema_name}'. Provide the singular table schema name.{plural_hint}",
+            subcode=METADATA_ENTITYSET_NOT_FOUND,
+        )
+
     # ---------------------- Table metadata helpers ----------------------
+    def _get_entity_definition(
+        self,
+        logical_name: str,
+        params: Dict[str, Any],
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """GET ``EntityDefinitions(LogicalName='...')`` by key.
+
+        Keyed navigation returns the single definition object directly rather than
+        a filtered ``value`` collection. A collection-shaped body is still unwrapped.
+
+        :param logical_name: Lowercase table logical name.
+        :return: The entity definition, or ``None`` if the table does not exist.
+        """
+        url = f"{self._entity_definitions_url}(LogicalName='{self._escape_odata_quotes(logical_name)}')"
+        try:
+            r = self._request("get", url, params=params, headers=headers)
+        except HttpError as err:
+            if getattr(err, "status_code", None) == 404:
+                return None
+            raise
+        try:
+            body = r.json()
+        except ValueError:
+            return None
+        if not isinstance(body, dict):
+            return None
+        if "value" in body:
+            items = body["value"]
+            return items[0] if isinstance(items, list) and items and isinstance(items[0], dict) else None
+        return body
+
     def _get_entity_by_table_schema_name(
         self,
         table_schema_name: str,
@@ -797,17 +893,12 @@ class _ODataClient(_FileUploadMixin, _RelationshipOperationsMixin, _ODataBase):
         for case-insensitive matching. The response includes SchemaName, LogicalName,
         EntitySetName, and MetadataId.
         """
-        url = f"{self.api}/EntityDefinitions"
         # LogicalName is stored lowercase, so we lowercase the input for lookup
-        logical_lower = table_schema_name.lower()
-        logical_escaped = self._escape_odata_quotes(logical_lower)
-        params = {
-            "$select": "MetadataId,LogicalName,SchemaName,EntitySetName,PrimaryNameAttribute,PrimaryIdAttribute",
-            "$filter": f"LogicalName eq '{logical_escaped}'",
-        }
-        r = self._request("get", url, params=params, headers=headers)
-        items = r.json().get("value", [])
-        return items[0] if items else None
+        return self._get_entity_definition(
+            self._normalize_cache_key(table_schema_name),
+            {"$select": _ENTITY_DEFINITION_SELECT},
+            headers=headers,
+        )
 
     def _create_entity(
         self,
@@ -816,7 +907,7 @@ class _ODataClient(_FileUploadMixin, _RelationshipOperationsMixin, _ODataBase):
         attributes: List[Dict[str, Any]],
         solution_unique_name: Optional[str] = None,
     ) -> Dict[str, Any]:
-        url = f"{self.api}/EntityDefinitions"
+        url = self._entity_definitions_url
         payload = {
             "@odata.type": "Microsoft.Dynamics.CRM.EntityMetadata",
             "SchemaName": table_schema_name,
@@ -829,32 +920,43 @@ class _ODataClient(_FileUploadMixin, _RelationshipOperationsMixin, _ODataBase):
             "IsActivity": False,
             "Attributes": attributes,
         }
-        params = None
+        # Ask for the created definition back so the follow-up lookup can be skipped
+        params = {"$select": _ENTITY_DEFINITION_SELECT}
         if solution_unique_name:
-            params = {"SolutionUniqueName": solution_unique_name}
-        self._request("post", url, json=payload, params=params)
-        ent = self._get_entity_by_table_schema_name(
-            table_schema_name,
-            headers={"Consistency": "Strong"},
-        )
+            params["SolutionUniqueName"] = solution_unique_name
+        r = self._request("post", url, json=payload, params=params, headers={"Prefer": "return=representation"})
+        cache_key = self._normalize_cache_key(table_schema_name)
+        self._entityset_miss_cache.pop(cache_key, None)
+        try:
+            ent = r.json() if r.text else None
+        except ValueError:
+            ent = None
+        if not isinstance(ent, dict) or not ent.get("EntitySetName") or not ent.get("MetadataId"):
+            # Service did not echo the definition (204 No Content); read it back instead
+            ent = self._get_entity_by_table_schema_name(
+                table_schema_name,
+                headers={"Consistency": "Strong"},
+            )
         if not ent or not ent.get("EntitySetName"):
             raise RuntimeError(
                 f"Failed to create or retrieve entity '{table_schema_name}' (EntitySetName not available)."
             )
         if not ent.get("MetadataId"):
             raise RuntimeError(f"MetadataId missing after creating entity '{table_schema_name}'.")
+        # Seed the same caches _entity_set_from_schema_name fills, so the first records call skips its lookup
+        self._logical_to_entityset_cache[cache_key] = ent["EntitySetName"]
+        primary_id_attr = ent.get("PrimaryIdAttribute")
+        if isinstance(primary_id_attr, str) and primary_id_attr:
+            self._logical_primaryid_cache[cache_key] = primary_id_attr
         return ent
 
-    def _get_attribute_metadata(
-        self,
-        entity_metadata_id: str,
-        column_name: str,
-        extra_select: Optional[str] = None,
-    ) -> Optional[Dict[str, Any]]:
-        # Convert to lowercase logical name for lookup
-        logical_name = column_name.lower()
-        attr_escaped = self._escape_odata_quotes(logical_name)
-        url = f"{self.api}/EntityDefinitions({entity_metadata_id})/Attributes"
+    @staticmethod
+    def _attribute_select_fields(extra_select: Optional[str] = None) -> List[str]:
+        """Return the ``$select`` fields for an attribute lookup plus any ``extra_select`` properties.
+
+        Annotation pieces (starting with ``@``) are skipped; they are returned by the
+        service without being selected.
+        """
         select_fields = ["MetadataId", "LogicalName", "SchemaName"]
         if extra_select:
             for piece in extra_select.split(","):
@@ -865,8 +967,70 @@ class _ODataClient(_FileUploadMixin, _RelationshipOperationsMixin, _ODataBase):
                     continue
                 if piece not in select_fields:
                     select_fields.append(piece)
+        return select_fields
+
+    def _get_entity_with_attributes(
+        self,
+        table_schema_name: str,
+        column_names: List[str],
+        extra_select: Optional[str] = None,
+    ) -> tuple[Optional[Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+        """Get entity metadata and the named attributes in a single request. Case-insensitive.
+
+        Equivalent to :meth:`_get_entity_by_table_schema_name` followed by one
+        :meth:`_get_attribute_metadata` call per column, but expands the matching
+        attributes on the entity definition instead of issuing further requests.
+
+        :return: ``(entity, attributes)``; ``entity`` is ``None`` when the table does not
+            exist, and ``attributes`` maps lowercase logical name to attribute metadata
+            for the columns that exist.
+        """
+        logical_names = dict.fromkeys(name.lower() for name in column_names)
+        params = {"$select": _ENTITY_DEFINITION_SELECT}
+        if logical_names:
+            # An empty $filter= inside $expand is malformed OData; only expand when columns were asked for
+            attr_filter = " or ".join(f"LogicalName eq '{self._escape_odata_quotes(name)}'" for name in logical_names)
+            attr_select = ",".join(self._attribute_select_fields(extra_select))
+            params["$expand"] = f"Attributes($select={attr_select};$filter={attr_filter})"
+        ent = self._get_entity_definition(self._normalize_cache_key(table_schema_name), params)
+        if ent is None:
+            return None, {}
+        attrs = ent.pop("Attributes", None)
+        found: Dict[str, Dict[str, Any]] = {}
+        if isinstance(attrs, list):
+            for item in attrs:
+                if isinstance(item, dict) and isinstance(item.get("LogicalName"), str):
+                    found[item["LogicalName"].lower()] = item
+        return ent, found
+
+    def _get_entity_with_attribute(
+        self,
+        table_schema_name: str,
+        column_name: str,
+        extra_select: Optional[str] = None,
+    ) -> tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """Get entity metadata and one of its attributes in a single request. Case-insensitive.
+
+        Single-column form of :meth:`_get_entity_with_attributes`.
+
+        :return: ``(entity, attribute)``; ``entity`` is ``None`` when the table does not
+            exist and ``attribute`` is ``None`` when the column does not exist.
+        """
+        ent, attrs = self._get_entity_with_attributes(table_schema_name, [column_name], extra_select)
+        return ent, attrs.get(column_name.lower())
+
+    def _get_attribute_metadata(
+        self,
+        entity_metadata_id: str,
+        column_name: str,
+        extra_select: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        # Convert to lowercase logical name for lookup
+        logical_name = column_name.lower()
+        attr_escaped = self._escape_odata_quotes(logical_name)
+        url = f"{self.api}/EntityDefinitions({entity_metadata_id})/Attributes"
         params = {
-            "$select": ",".join(select_fields),
+            "$select": ",".join(self._attribute_select_fields(extra_select)),
             "$filter": f"LogicalName eq '{attr_escaped}'",
         }
         r = self._request("get", url, params=params)
@@ -961,15 +1125,14 @@ class _ODataClient(_FileUploadMixin, _RelationshipOperationsMixin, _ODataBase):
 
     def _request_metadata_with_retry(self, method: str, url: str, **kwargs):
         """Fetch metadata with retries on transient errors."""
-        max_attempts = 5
-        backoff_seconds = 0.4
-        for attempt in range(1, max_attempts + 1):
+        max_attempts = len(_METADATA_BACKOFF) + 1
+        for attempt in range(max_attempts):
             try:
                 return self._request(method, url, **kwargs)
             except HttpError as err:
                 if getattr(err, "status_code", None) == 404:
-                    if attempt < max_attempts:
-                        time.sleep(backoff_seconds * (2 ** (attempt - 1)))
+                    if attempt < len(_METADATA_BACKOFF):
+                        time.sleep(_METADATA_BACKOFF[attempt])
                         continue
                     raise RuntimeError(f"Metadata request failed after {max_attempts} retries (404): {url}") from err
                 raise
@@ -988,7 +1151,7 @@ class _ODataClient(_FileUploadMixin, _RelationshipOperationsMixin, _ODataBase):
         if isinstance(table_entry, dict) and (now - table_entry.get("ts", 0)) < self._picklist_cache_ttl_seconds:
             return
 
-        table_esc = self._escape_odata_quotes(table_schema_name.lower())
+        table_esc = self._escape_odata_quotes(table_key)
         url = (
             f"{self.api}/EntityDefinitions(LogicalName='{table_esc}')"
             f"/Attributes/Microsoft.Dynamics.CRM.PicklistAttributeMetadata"
@@ -1293,9 +1456,8 @@ class _ODataClient(_FileUploadMixin, _RelationshipOperationsMixin, _ODataBase):
         if primary_column_schema_name:
             primary_attr_schema = primary_column_schema_name
         else:
-            primary_attr_schema = (
-                f"{table_schema_name.split('_',1)[0]}_Name" if "_" in table_schema_name else "new_Name"
-            )
+            prefix, sep, _ = table_schema_name.partition("_")
+            primary_attr_schema = f"{prefix}_Name" if sep else "new_Name"
 
         attributes: List[Dict[str, Any]] = []
         attributes.append(self._attribute_payload(primary_attr_schema, "string", is_primary_name=True))
@@ -1421,7 +1583,8 @@ class _ODataClient(_FileUploadMixin, _RelationshipOperationsMixin, _ODataBase):
             if not isinstance(name, str) or not name.strip():
                 raise ValueError("column names must be non-empty strings")
 
-        ent = self._get_entity_by_table_schema_name(table_schema_name)
+        # Table and all requested columns in one metadata request
+        ent, attrs = self._get_entity_with_attributes(table_schema_name, names, extra_select="AttributeType")
         if not ent or not ent.get("MetadataId"):
             raise MetadataError(
                 f"Table '{table_schema_name}' not found.",
@@ -1435,7 +1598,7 @@ class _ODataClient(_FileUploadMixin, _RelationshipOperationsMixin, _ODataBase):
         needs_picklist_flush = False
 
         for column_name in names:
-            attr_meta = self._get_attribute_metadata(metadata_id, column_name, extra_select="@odata.type,AttributeType")
+            attr_meta = attrs.get(column_name.lower())
             if not attr_meta:
                 raise MetadataError(
                     f"Column '{column_name}' not found on table '{entity_schema}'.",
@@ -1622,7 +1785,7 @@ class _ODataClient(_FileUploadMixin, _RelationshipOperationsMixin, _ODataBase):
             record_processed = self._lowercase_keys(record)
             record_processed = self._convert_labels_to_ints(table, record_processed)
             conflicting = {
-                k for k in set(alt_key_lower) & set(record_processed) if alt_key_lower[k] != record_processed[k]
+                k for k in alt_key_lower.keys() & record_processed.keys() if alt_key_lower[k] != record_processed[k]
             }
             if conflicting:
                 raise ValidationError(
@@ -9,11 +9,13 @@ URL construction, payload building, cache helpers, and other stateless logic.
 
 from __future__ import annotations
 
+import functools
 import json
 import re
 import unicodedata
 import uuid
 import warnings
+from collections import OrderedDict
 from contextlib import contextmanager
 from contextvars import ContextVar
 from dataclasses import dataclass, field
@@ -47,6 +49,55 @@ _USER_AGENT = f"DataverseSvcPythonClient:{_SDK_VERSION}"
 _DEFAULT_EXPECTED_STATUSES: tuple[int, ...] = (200, 201, 202, 204)
 
 
+@functools.lru_cache(maxsize=4096)
+def _lower_name(name: str) -> str:
+    """Lowercase a table or column name, memoized.
+
+    The set of names a client touches is small and they are normalized on
+    every CRUD call and metadata cache lookup, so a bounded cache avoids
+    re-allocating the same lowercase strings.
+    """
+    return name.lower()
+
+
+_NON_ALNUM_RE = re.compile(r"[^A-Za-z0-9]+")
+
+
+@functools.lru_cache(maxsize=4096)
+def _pascal_name(name: str) -> str:
+    """PascalCase a snake_case / delimited name, memoized (pure function of its input)."""
+    return "".join(p[:1].upper() + p[1:] for p in _NON_ALNUM_RE.split(name) if p)
+
+
+class _LRUDict(OrderedDict):
+    """Dict that evicts its least recently used entry once it holds more than ``maxsize`` entries.
+
+    ``get``, ``[]`` and assignment count as use. Used for the per-client metadata
+    caches so long-running clients that touch many tables stay bounded.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        super().__init__()
+        self.maxsize = maxsize
+
+    def __getitem__(self, key: Any) -> Any:
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
+
+
 def _extract_pagingcookie(next_link: str) -> Optional[str]:
     """Extract the raw pagingcookie value from a SQL ``@odata.nextLink`` URL.
 
@@ -75,7 +126,7 @@ def _extract_pagingcookie(next_link: str) -> Optional[str]:
     return None
 
 
-@dataclass
+@dataclass(slots=True)
 class _RequestContext:
     """Structured request context used by ``_request`` to clarify payload and metadata."""
 
@@ -131,17 +182,24 @@ class _ODataBase:
         if not self.base_url:
             raise ValueError("base_url is required.")
         self.api = f"{self.base_url}/api/data/v9.2"
+        # Prebuilt once: the metadata collection endpoint is hit on every cold table lookup
+        self._entity_definitions_url = f"{self.api}/EntityDefinitions"
         self.config = (
             config
             or __import__(
                 "PowerPlatform.Dataverse.core.config", fromlist=["DataverseConfig"]
             ).DataverseConfig.from_env()
         )
-        self._logical_to_entityset_cache: dict[str, str] = {}
+        # Cache: normalized table_schema_name (lowercase) -> entity set name (e.g. accounts)
+        self._logical_to_entityset_cache: _LRUDict = _LRUDict(maxsize=2048)
         # Cache: normalized table_schema_name (lowercase) -> primary id attribute (e.g. accountid)
-        self._logical_primaryid_cache: dict[str, str] = {}
-        self._picklist_label_cache: dict[str, dict] = {}
+        self._logical_primaryid_cache: _LRUDict = _LRUDict(maxsize=2048)
+        # Cache: normalized table_schema_name -> {"ts": fetched_at, "picklists": {attr: {label: value}}}
+        self._picklist_label_cache: _LRUDict = _LRUDict(maxsize=256)
         self._picklist_cache_ttl_seconds = 3600  # 1 hour TTL
+        # Cache: normalized table_schema_name -> time.time() of the last "not found" entity set lookup
+        self._entityset_miss_cache: _LRUDict = _LRUDict(maxsize=256)
+        self._entityset_miss_ttl_seconds = 60
         ctx_obj = self.config.operation_context
         self._operation_context: Optional[str] = ctx_obj.user_agent_context if ctx_obj else None
         self._http_logger = None
@@ -162,7 +220,7 @@ class _ODataBase:
     @staticmethod
     def _normalize_cache_key(table_schema_name: str) -> str:
         """Normalize table_schema_name to lowercase for case-insensitive cache keys."""
-        return table_schema_name.lower() if isinstance(table_schema_name, str) else ""
+        return _lower_name(table_schema_name) if isinstance(table_schema_name, str) else ""
 
     @staticmethod
     def _lowercase_keys(record: Dict[str, Any]) -> Dict[str, Any]:
@@ -262,15 +320,14 @@ class _ODataBase:
         bad_keys = [k for k in alternate_key if not isinstance(k, str)]
         if bad_keys:
             raise TypeError(f"alternate_key keys must be strings; got: {bad_keys!r}")
-        parts = []
-        for k, v in alternate_key.items():
-            k_lower = k.lower() if isinstance(k, str) else k
-            if isinstance(v, str):
-                v_escaped = self._escape_odata_quotes(v)
-                parts.append(f"{k_lower}='{v_escaped}'")
-            else:
-                parts.append(f"{k_lower}={v}")
-        return ",".join(parts)
+        escape = self._escape_odata_quotes
+        # Keys are validated as str above; a list (not a generator) because str.join materializes its input anyway
+        return ",".join(
+            [
+                f"{_lower_name(k)}='{escape(v)}'" if isinstance(v, str) else f"{_lower_name(k)}={v}"
+                for k, v in alternate_key.items()
+            ]
+        )
 
     def _label(self, text: str) -> Dict[str, Any]:
         lang = int(self.config.language_code)
@@ -286,8 +343,7 @@ class _ODataBase:
         }
 
     def _to_pascal(self, name: str) -> str:
-        parts = re.split(r"[^A-Za-z0-9]+", name)
-        return "".join(p[:1].upper() + p[1:] for p in parts if p)
+        return _pascal_name(name)
 
     def _normalize_picklist_label(self, label: str) -> str:
         """Normalize a label for case / diacritic insensitive comparison."""
@@ -408,7 +464,7 @@ class _ODataBase:
                 }
             )
 
-        attr_label = column_schema_name.split("_")[-1]
+        attr_label = column_schema_name.rpartition("_")[2]
         return {
             "@odata.type": "Microsoft.Dynamics.CRM.PicklistAttributeMetadata",
             "SchemaName": column_schema_name,
@@ -433,7 +489,7 @@ class _ODataBase:
                 f"Unsupported column spec type for '{column_schema_name}': {type(dtype)} (expected str or Enum subclass)"
             )
         dtype_l = dtype.lower().strip()
-        label = column_schema_name.split("_")[-1]
+        label = column_schema_name.rpartition("_")[2]
         if dtype_l in ("string", "text"):
             return {
                 "@odata.type": "Microsoft.Dynamics.CRM.StringAttributeMetadata",
@@ -537,7 +593,8 @@ class _ODataBase:
         if primary_column:
             primary_attr = primary_column
         else:
-            primary_attr = f"{table.split('_', 1)[0]}_Name" if "_" in table else "new_Name"
+            prefix, sep, _ = table.partition("_")
+            primary_attr = f"{prefix}_Name" if sep else "new_Name"
         attributes = [self._attribute_payload(primary_attr, "string", is_primary_name=True)]
         for col_name, dtype in columns.items():
             attr = self._attribute_payload(col_name, dtype)
@@ -903,6 +960,7 @@ class _ODataBase:
         """
         self._logical_to_entityset_cache.clear()
         self._logical_primaryid_cache.clear()
+        self._entityset_miss_cache.clear()
         self._picklist_label_cache.clear()
         if self._http_logger is not None:
             self._http_logger.close()
@@ -918,19 +976,26 @@ class _ODataBase:
     ) -> int:
         """Flush cached client metadata/state.
 
-        :param kind: Cache kind to flush (only ``"picklist"`` supported).
+        :param kind: Cache kind to flush: ``"picklist"`` or ``"entityset"`` (entity set,
+            primary id and cached "table not found" lookups).
         :type kind: ``str``
         :return: Number of cache entries removed.
         :rtype: ``int``
         :raises ValidationError: If ``kind`` is unsupported.
         """
         k = (kind or "").strip().lower()
-        if k != "picklist":
+        if k == "picklist":
+            caches = [self._picklist_label_cache]
+        elif k == "entityset":
+            caches = [self._logical_to_entityset_cache, self._logical_primaryid_cache, self._entityset_miss_cache]
+        else:
             raise ValidationError(
-                f"Unsupported cache kind '{kind}' (only 'picklist' is implemented)",
+                f"Unsupported cache kind '{kind}' (supported: 'picklist', 'entityset')",
                 subcode=VALIDATION_UNSUPPORTED_CACHE_KIND,
             )
 
-        removed = len(self._picklist_label_cache)
-        self._picklist_label_cache.clear()
+        removed = 0
+        for cache in caches:
+            removed += len(cache)
+            cache.clear()
         return removed
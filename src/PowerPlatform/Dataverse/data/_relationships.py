@@ -14,6 +14,8 @@ __all__ = []
 import re
 from typing import Any, Dict, List, Optional
 
+_ENTITY_ID_RE = re.compile(r"\(([0-9a-fA-F-]+)\)")
+
 
 class _RelationshipOperationsMixin:
     """
@@ -255,5 +257,5 @@ class _RelationshipOperationsMixin:
         """
         if not header_value:
             return None
-        match = re.search(r"\(([0-9a-fA-F-]+)\)", header_value)
+        match = _ENTITY_ID_RE.search(header_value)
         return match.group(1) if match else None
@@ -45,18 +45,14 @@ class _FileUploadMixin:
         # Resolve entity set from table schema name
         entity_set = self._entity_set_from_schema_name(table_schema_name)
 
-        # Check if the file column exists, create it if it doesn't
-        entity_metadata = self._get_entity_by_table_schema_name(table_schema_name)
-        if entity_metadata:
-            metadata_id = entity_metadata.get("MetadataId")
-            if metadata_id:
-                attr_metadata = self._get_attribute_metadata(metadata_id, file_name_attribute)
-                if not attr_metadata:
-                    # Attribute doesn't exist, create it
-                    self._create_columns(table_schema_name, {file_name_attribute: "file"})
-                    # Wait for the attribute to become visible in the data API
-                    # Raises RuntimeError with underlying exception if timeout occurs
-                    self._wait_for_attribute_visibility(entity_set, file_name_attribute)
+        # Check if the file column exists (table + column in one metadata request), create it if it doesn't
+        entity_metadata, attr_metadata = self._get_entity_with_attribute(table_schema_name, file_name_attribute)
+        if entity_metadata and entity_metadata.get("MetadataId") and not attr_metadata:
+            # Attribute doesn't exist, create it
+            self._create_columns(table_schema_name, {file_name_attribute: "file"})
+            # Wait for the attribute to become visible in the data API
+            # Raises RuntimeError with underlying exception if timeout occurs
+            self._wait_for_attribute_visibility(entity_set, file_name_attribute)
 
         mode = (mode or "auto").lower()
 
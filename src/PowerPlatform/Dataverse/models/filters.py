@@ -39,7 +39,7 @@ import enum
 import uuid
 import warnings
 from datetime import date, datetime, timezone
-from typing import Any, Collection, List
+from typing import Any, Callable, Collection, Dict, List
 
 __all__ = [
     "FilterExpression",
@@ -70,6 +70,31 @@ __all__ = [
 # ---------------------------------------------------------------------------
 
 
+def _format_null(value: None) -> str:
+    return "null"
+
+
+def _format_bool(value: bool) -> str:
+    return "true" if value else "false"
+
+
+def _format_str(value: str) -> str:
+    escaped = value.replace("'", "''")
+    return f"'{escaped}'"
+
+
+# Formatters for the common exact types, looked up by ``type(value)``.  Exact-type
+# keys sidestep the bool/int and IntEnum/int ordering concerns; subclasses and
+# everything else go through the isinstance chain in _format_value.
+_EXACT_TYPE_FORMATTERS: Dict[type, Callable[[Any], str]] = {
+    type(None): _format_null,
+    bool: _format_bool,
+    int: str,
+    float: str,
+    str: _format_str,
+}
+
+
 def _format_value(value: Any) -> str:
     """Format a Python value for OData query syntax.
 
@@ -81,6 +106,9 @@ def _format_value(value: Any) -> str:
         of ``int`` in Python.  Without this ordering ``True`` would format
         as ``1`` instead of ``true``.
     """
+    formatter = _EXACT_TYPE_FORMATTERS.get(type(value))
+    if formatter is not None:
+        return formatter(value)
     if value is None:
         return "null"
     # bool MUST be checked before int (bool is a subclass of int)
@@ -94,8 +122,7 @@ def _format_value(value: Any) -> str:
     if isinstance(value, float):
         return str(value)
     if isinstance(value, str):
-        escaped = value.replace("'", "''")
-        return f"'{escaped}'"
+        return _format_str(value)
     if isinstance(value, datetime):
         # Convert timezone-aware datetimes to UTC; assume naive datetimes are UTC
         if value.tzinfo is not None:
@@ -391,33 +418,36 @@ class ColumnProxy:
 
     # ---------------------------------------------------------------- comparisons
 
+    # Build _ComparisonFilter directly rather than through the _<op>_impl helpers:
+    # comparisons are the hot path of every where() clause.
+
     def __eq__(self, other: Any) -> FilterExpression:  # type: ignore[override]
-        return _eq_impl(self._column, other)
+        return _ComparisonFilter(self._column, "eq", other)
 
     def __ne__(self, other: Any) -> FilterExpression:  # type: ignore[override]
-        return _ne_impl(self._column, other)
+        return _ComparisonFilter(self._column, "ne", other)
 
     def __gt__(self, other: Any) -> FilterExpression:
-        return _gt_impl(self._column, other)
+        return _ComparisonFilter(self._column, "gt", other)
 
     def __ge__(self, other: Any) -> FilterExpression:
-        return _ge_impl(self._column, other)
+        return _ComparisonFilter(self._column, "ge", other)
 
     def __lt__(self, other: Any) -> FilterExpression:
-        return _lt_impl(self._column, other)
+        return _ComparisonFilter(self._column, "lt", other)
 
     def __le__(self, other: Any) -> FilterExpression:
-        return _le_impl(self._column, other)
+        return _ComparisonFilter(self._column, "le", other)
 
     # ---------------------------------------------------------------- null checks
 
     def is_null(self) -> FilterExpression:
         """Column equals null: ``column eq null``."""
-        return _eq_impl(self._column, None)
+        return _ComparisonFilter(self._column, "eq", None)
 
     def is_not_null(self) -> FilterExpression:
         """Column not null: ``column ne null``."""
-        return _ne_impl(self._column, None)
+        return _ComparisonFilter(self._column, "ne", None)
 
     # ---------------------------------------------------------------- in / not-in
 
@@ -441,7 +471,7 @@ class ColumnProxy:
 
     def between(self, lo: Any, hi: Any) -> FilterExpression:
         """Between filter: ``(column ge lo and column le hi)``."""
-        return _ge_impl(self._column, lo) & _le_impl(self._column, hi)
+        return _AndFilter(_ComparisonFilter(self._column, "ge", lo), _ComparisonFilter(self._column, "le", hi))
 
     def not_between(self, lo: Any, hi: Any) -> FilterExpression:
         """Not-between filter: ``not (column ge lo and column le hi)``."""
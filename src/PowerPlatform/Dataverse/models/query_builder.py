@@ -51,7 +51,7 @@ from __future__ import annotations
 
 import sys
 import warnings
-from typing import Any, Iterator, List, Optional, TypedDict, Union
+from typing import Any, Iterator, List, Optional, Tuple, TypedDict, Union
 
 # typing.Self (PEP 673, Python 3.11+) makes fluent methods return the concrete
 # subclass type. TypeVar fallback for Python 3.10 uses the same name so docs render identically.
@@ -116,11 +116,14 @@ class ExpandOption:
                  .execute())
     """
 
+    __slots__ = ("relation", "_select", "_filter", "_orderby", "_top")
+
     def __init__(self, relation: str) -> None:
         self.relation = relation
-        self._select: List[str] = []
+        # Empty tuples until first use; replaced by a list on the first append.
+        self._select: Union[Tuple[()], List[str]] = ()
         self._filter: Optional[str] = None
-        self._orderby: List[str] = []
+        self._orderby: Union[Tuple[()], List[str]] = ()
         self._top: Optional[int] = None
 
     def select(self, *columns: str) -> ExpandOption:
@@ -129,7 +132,10 @@ class ExpandOption:
         :param columns: Column names to select.
         :return: Self for method chaining.
         """
-        self._select.extend(columns)
+        if isinstance(self._select, list):
+            self._select.extend(columns)
+        else:
+            self._select = list(columns)
         return self
 
     def filter(self, filter_str: str) -> ExpandOption:
@@ -149,7 +155,10 @@ class ExpandOption:
         :return: Self for method chaining.
         """
         order = f"{column} desc" if descending else column
-        self._orderby.append(order)
+        if isinstance(self._orderby, list):
+            self._orderby.append(order)
+        else:
+            self._orderby = [order]
         return self
 
     def top(self, count: int) -> ExpandOption:
@@ -194,15 +203,33 @@ class _QueryBuilderBase:
     for async clients.
     """
 
+    __slots__ = (
+        "table",
+        "_select",
+        "_filter_parts",
+        "_filter_cache",
+        "_orderby",
+        "_expand",
+        "_top",
+        "_page_size",
+        "_count",
+        "_include_annotations",
+        "_query_ops",
+    )
+
     def __init__(self, table: str) -> None:
         table = table.strip() if table else ""
         if not table:
             raise ValueError("table name is required")
         self.table = table
-        self._select: List[str] = []
+        # _select/_orderby/_expand stay empty tuples until first use; most
+        # builders never touch all three.
+        self._select: Union[Tuple[()], List[str]] = ()
         self._filter_parts: List[Union[str, filters.FilterExpression]] = []
-        self._orderby: List[str] = []
-        self._expand: List[str] = []
+        # (number of _filter_parts already joined, joined string); parts are append-only
+        self._filter_cache: Tuple[int, str] = (0, "")
+        self._orderby: Union[Tuple[()], List[str]] = ()
+        self._expand: Union[Tuple[()], List[str]] = ()
         self._top: Optional[int] = None
         self._page_size: Optional[int] = None
         self._count: bool = False
@@ -224,7 +251,10 @@ class _QueryBuilderBase:
 
             query = QueryBuilder("account").select("name", "telephone1", "revenue")
         """
-        self._select.extend(columns)
+        if isinstance(self._select, list):
+            self._select.extend(columns)
+        else:
+            self._select = list(columns)
         return self
 
     # ------------------------------------------------------ filter: expression tree
@@ -268,7 +298,10 @@ class _QueryBuilderBase:
         :return: Self for method chaining.
         """
         order = f"{column.lower()} desc" if descending else column.lower()
-        self._orderby.append(order)
+        if isinstance(self._orderby, list):
+            self._orderby.append(order)
+        else:
+            self._orderby = [order]
         return self
 
     # --------------------------------------------------------------- pagination
@@ -400,11 +433,11 @@ class _QueryBuilderBase:
                              .filter("contains(subject,'Task')")
                              .top(5)))
         """
-        for rel in relations:
-            if isinstance(rel, ExpandOption):
-                self._expand.append(rel.to_odata())
-            else:
-                self._expand.append(rel)
+        compiled = [rel.to_odata() if isinstance(rel, ExpandOption) else rel for rel in relations]
+        if isinstance(self._expand, list):
+            self._expand.extend(compiled)
+        else:
+            self._expand = compiled
         return self
 
     # --------------------------------------------------------------- build
@@ -425,13 +458,7 @@ class _QueryBuilderBase:
         if self._select:
             params["select"] = list(self._select)
         if self._filter_parts:
-            parts: List[str] = []
-            for part in self._filter_parts:
-                if isinstance(part, filters.FilterExpression):
-                    parts.append(part.to_odata())
-                else:
-                    parts.append(part)
-            params["filter"] = " and ".join(parts)
+            params["filter"] = self._filter_string()
         if self._orderby:
             params["orderby"] = list(self._orderby)
         if self._expand:
@@ -446,6 +473,20 @@ class _QueryBuilderBase:
             params["include_annotations"] = self._include_annotations
         return params
 
+    def _filter_string(self) -> str:
+        """AND-join ``_filter_parts``, compiling only the parts added since the last call."""
+        done, joined = self._filter_cache
+        parts = self._filter_parts
+        if done != len(parts):
+            compiled = [
+                part.to_odata() if isinstance(part, filters.FilterExpression) else part for part in parts[done:]
+            ]
+            if done:
+                compiled.insert(0, joined)
+            joined = " and ".join(compiled)
+            self._filter_cache = (len(parts), joined)
+        return joined
+
 
 class QueryBuilder(_QueryBuilderBase):
     """Fluent interface for building and executing OData queries against a sync client.
@@ -472,6 +513,8 @@ class QueryBuilder(_QueryBuilderBase):
             #  "filter": "statecode eq 0", "top": 10}
     """
 
+    __slots__ = ()
+
     # --------------------------------------------------------------- execute
 
     def execute(self, *, by_page=_BY_PAGE_UNSET) -> Union[QueryResult, Iterator[QueryResult]]:
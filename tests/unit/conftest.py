@@ -0,0 +1,56 @@
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT license.
+
+"""
+Shared pytest fixtures for the unit test tree.
+
+CI runs this tree under pytest-xdist (``-n auto --dist=loadfile``), so unit
+tests must not depend on each other or on global state left behind by another
+module: no network, no real sleeps, and any patching goes through fixtures or
+context managers that undo it.
+"""
+
+import time
+
+import pytest
+
+from PowerPlatform.Dataverse.models.labels import Label, LocalizedLabel
+from PowerPlatform.Dataverse.models.relationship import LookupAttributeMetadata
+
+
+@pytest.fixture(autouse=True)
+def sleep_calls(monkeypatch):
+    """Replace ``time.sleep`` with a recorder so retry/backoff paths never block.
+
+    Autouse for every unit test; request it explicitly to assert on the
+    recorded delays (one entry per ``time.sleep`` call).
+    """
+    calls = []
+    monkeypatch.setattr(time, "sleep", calls.append)
+    return calls
+
+
+@pytest.fixture
+def bind_sleep_calls(request, sleep_calls):
+    """Expose :func:`sleep_calls` as ``self.sleep_calls`` on ``unittest.TestCase`` tests.
+
+    TestCase methods cannot take fixtures as arguments; apply with
+    ``@pytest.mark.usefixtures("bind_sleep_calls")`` on the class.
+    """
+    request.instance.sleep_calls = sleep_calls
+
+
+# Metadata models are plain dataclasses whose ``to_dict`` only reads fields, so
+# the shared instances below are safe to reuse across the whole session.
+
+
+@pytest.fixture(scope="session")
+def account_label():
+    """``Label`` with a single English (1033) "Account" localized label."""
+    return Label(localized_labels=[LocalizedLabel(label="Account", language_code=1033)])
+
+
+@pytest.fixture(scope="session")
+def account_lookup(account_label):
+    """``LookupAttributeMetadata`` for a ``new_AccountId`` lookup column."""
+    return LookupAttributeMetadata(schema_name="new_AccountId", display_name=account_label)
@@ -1,6 +1,11 @@
 # Copyright (c) Microsoft Corporation.
 # Licensed under the MIT license.
 
+import json
+from collections import deque
+from dataclasses import dataclass
+from typing import Any
+
 import pytest
 from azure.core.credentials import TokenCredential
 from PowerPlatform.Dataverse.client import DataverseClient
@@ -18,38 +23,34 @@ class DummyAuth:
         return T()
 
 
-class DummyHTTP:
-    def __init__(self, responses):
-        self._responses = responses
-
-    def _request(self, method, url, **kwargs):
-        if not self._responses:
-            raise AssertionError("No more responses")
-        status, headers, body = self._responses.pop(0)
+@dataclass(slots=True)
+class FakeResponse:
+    status_code: int
+    headers: dict
+    text: str
+    _json: Any
 
-        class R:
-            pass
+    def json(self):
+        if isinstance(self._json, Exception):
+            raise self._json
+        return self._json
 
-        r = R()
-        r.status_code = status
-        r.headers = headers
-        if isinstance(body, dict):
-            import json
 
-            r.text = json.dumps(body)
+def _make_response(status, headers, body):
+    if isinstance(body, dict):
+        return FakeResponse(status, headers, json.dumps(body), body)
+    return FakeResponse(status, headers, body or "", ValueError("non-json"))
 
-            def json_func():
-                return body
 
-            r.json = json_func
-        else:
-            r.text = body or ""
-
-            def json_fail():
-                raise ValueError("non-json")
+class DummyHTTP:
+    def __init__(self, responses):
+        # Build responses up front so bodies are encoded once per test, not per request.
+        self._responses = deque(_make_response(*spec) for spec in responses)
 
-            r.json = json_fail
-        return r
+    def _request(self, method, url, **kwargs):
+        if not self._responses:
+            raise AssertionError("No more responses")
+        return self._responses.popleft()
 
 
 class MockClient(_ODataClient):
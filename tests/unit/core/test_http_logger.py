@@ -26,6 +26,39 @@ def _make_logger(tmp_path, **kwargs) -> _HttpLogger:
     return _HttpLogger(cfg)
 
 
+class _FakeResponse:
+    """Minimal stand-in for requests.Response as consumed by _HttpClient."""
+
+    def __init__(self, status_code=200, headers=None, text=""):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.text = text
+
+
+class _UndecodedResponse(_FakeResponse):
+    """Response whose body must never be decoded."""
+
+    @property
+    def text(self):
+        raise AssertionError("resp.text should not be accessed")
+
+    @text.setter
+    def text(self, value):
+        pass
+
+
+class _FakeSession:
+    """Session that replays a fixed outcome: a response to return or an exception to raise."""
+
+    def __init__(self, outcome):
+        self._outcome = outcome
+
+    def request(self, method, url, **kwargs):
+        if isinstance(self._outcome, BaseException):
+            raise self._outcome
+        return self._outcome
+
+
 def _read_log(tmp_path) -> str:
     """Return the concatenated content of all .log files in tmp_path."""
     parts = []
@@ -383,42 +416,45 @@ def test_body_logging_enabled_true_when_set(tmp_path):
     assert logger.body_logging_enabled is True
 
 
+def test_request_and_response_skipped_above_debug_level(tmp_path):
+    """With log_level above DEBUG, request/response records are not formatted or written."""
+    from unittest.mock import patch
+
+    logger = _make_logger(tmp_path, log_level="ERROR", max_body_bytes=4096)
+    with patch.object(logger, "_redact_headers") as redact:
+        logger.log_request("GET", "https://example.com", headers={"Accept": "*/*"}, body={"a": 1})
+        logger.log_response("GET", "https://example.com", status_code=200, headers={}, body="ok")
+    redact.assert_not_called()
+    assert ">>> REQUEST" not in _read_log(tmp_path)
+
+
+def test_body_not_serialized_when_capture_disabled(tmp_path):
+    """max_body_bytes=0 returns before JSON-encoding the body."""
+    from unittest.mock import patch
+
+    logger = _make_logger(tmp_path)
+    with patch("PowerPlatform.Dataverse.core._http_logger._json.dumps") as dumps:
+        logger.log_request("POST", "https://example.com", body={"name": "x"})
+    dumps.assert_not_called()
+
+
 # ---------------------------------------------------------------------------
 # Integration: _HttpClient with logger=None (no errors)
 # ---------------------------------------------------------------------------
 
 
 def test_http_client_no_logger_no_errors():
-    from unittest.mock import MagicMock
-
     from PowerPlatform.Dataverse.core._http import _HttpClient
 
-    mock_resp = MagicMock()
-    mock_resp.status_code = 200
-    mock_resp.headers = {}
-    mock_resp.text = ""
-
-    session = MagicMock()
-    session.request.return_value = mock_resp
-
-    client = _HttpClient(session=session, logger=None)
+    client = _HttpClient(session=_FakeSession(_FakeResponse()), logger=None)
     resp = client._request("GET", "https://example.com")
     assert resp.status_code == 200
 
 
 def test_http_client_with_logger_logs_request_and_response(tmp_path):
-    from unittest.mock import MagicMock
-
     from PowerPlatform.Dataverse.core._http import _HttpClient
 
-    mock_resp = MagicMock()
-    mock_resp.status_code = 201
-    mock_resp.headers = {"Content-Type": "application/json"}
-    mock_resp.text = '{"value": "ok"}'
-
-    session = MagicMock()
-    session.request.return_value = mock_resp
-
+    session = _FakeSession(_FakeResponse(201, {"Content-Type": "application/json"}, '{"value": "ok"}'))
     cfg = LogConfig(log_folder=str(tmp_path))
     http_logger = _HttpLogger(cfg)
     client = _HttpClient(session=session, logger=http_logger)
@@ -431,24 +467,34 @@ def test_http_client_with_logger_logs_request_and_response(tmp_path):
     assert "201" in content
 
 
+def test_http_client_logs_elapsed_from_perf_counter_ns(tmp_path):
+    """Response elapsed time is measured with perf_counter_ns and rendered in ms."""
+    from unittest.mock import patch
+
+    from PowerPlatform.Dataverse.core._http import _HttpClient
+
+    http_logger = _HttpLogger(LogConfig(log_folder=str(tmp_path)))
+    client = _HttpClient(session=_FakeSession(_FakeResponse()), logger=http_logger)
+    with patch("time.perf_counter_ns", side_effect=[1_000_000_000, 1_150_500_000]):
+        client._request("GET", "https://example.com")
+
+    assert "(150.5ms)" in _read_log(tmp_path)
+
+
 def test_http_client_logs_attempt_number_on_retry(tmp_path):
     """_HttpClient must pass attempt number and max_attempts to log_error on each retry."""
     import requests as req_lib
 
-    from unittest.mock import MagicMock, patch
-
     from PowerPlatform.Dataverse.core._http import _HttpClient
 
-    session = MagicMock()
-    session.request.side_effect = req_lib.exceptions.ConnectionError("timeout")
+    session = _FakeSession(req_lib.exceptions.ConnectionError("timeout"))
 
     cfg = LogConfig(log_folder=str(tmp_path))
     http_logger = _HttpLogger(cfg)
     client = _HttpClient(retries=2, backoff=0, session=session, logger=http_logger)
 
-    with patch("time.sleep"):  # skip backoff delay
-        with pytest.raises(req_lib.exceptions.ConnectionError):
-            client._request("GET", "https://example.com")
+    with pytest.raises(req_lib.exceptions.ConnectionError):
+        client._request("GET", "https://example.com")
 
     content = _read_log(tmp_path)
     assert "[attempt 1/2]" in content
@@ -483,21 +529,11 @@ def test_dataverse_config_from_env_log_config_none():
 
 def test_http_client_logs_empty_dict_body(tmp_path):
     """An empty JSON body {} is falsy but must still be logged (not skipped via `or`)."""
-    from unittest.mock import MagicMock
-
     from PowerPlatform.Dataverse.core._http import _HttpClient
 
-    mock_resp = MagicMock()
-    mock_resp.status_code = 200
-    mock_resp.headers = {}
-    mock_resp.text = ""
-
-    session = MagicMock()
-    session.request.return_value = mock_resp
-
     cfg = LogConfig(log_folder=str(tmp_path), max_body_bytes=4096)
     http_logger = _HttpLogger(cfg)
-    client = _HttpClient(session=session, logger=http_logger)
+    client = _HttpClient(session=_FakeSession(_FakeResponse()), logger=http_logger)
     client._request("POST", "https://example.com/accounts", json={})
 
     content = _read_log(tmp_path)
@@ -512,18 +548,10 @@ def test_http_client_logs_empty_dict_body(tmp_path):
 
 def test_http_client_does_not_decode_response_body_when_logging_disabled(tmp_path):
     """When max_body_bytes=0, resp.text must not be accessed (no unnecessary decoding)."""
-    from unittest.mock import MagicMock, PropertyMock
-
     from PowerPlatform.Dataverse.core._http import _HttpClient
 
-    mock_resp = MagicMock()
-    mock_resp.status_code = 200
-    mock_resp.headers = {}
     # If resp.text is accessed, the test will fail
-    type(mock_resp).text = PropertyMock(side_effect=AssertionError("resp.text should not be accessed"))
-
-    session = MagicMock()
-    session.request.return_value = mock_resp
+    session = _FakeSession(_UndecodedResponse())
 
     cfg = LogConfig(log_folder=str(tmp_path), max_body_bytes=0)
     http_logger = _HttpLogger(cfg)
@@ -532,6 +560,21 @@ def test_http_client_does_not_decode_response_body_when_logging_disabled(tmp_pat
     client._request("GET", "https://example.com")
 
 
+def test_http_client_does_not_decode_response_body_above_debug_level(tmp_path):
+    """With log_level above DEBUG, resp.text is not read even when body capture is enabled."""
+    from PowerPlatform.Dataverse.core._http import _HttpClient
+
+    http_logger = _HttpLogger(LogConfig(log_folder=str(tmp_path), max_body_bytes=4096, log_level="INFO"))
+    client = _HttpClient(session=_FakeSession(_UndecodedResponse()), logger=http_logger)
+    client._request("GET", "https://example.com")
+    assert "<<< RESPONSE" not in _read_log(tmp_path)
+
+
+def test_debug_enabled_follows_log_level(tmp_path):
+    assert _make_logger(tmp_path).debug_enabled is True
+    assert _make_logger(tmp_path, log_level="WARNING").debug_enabled is False
+
+
 # ---------------------------------------------------------------------------
 # Fix #4: _HttpLogger.close() releases file handle
 # ---------------------------------------------------------------------------
@@ -37,6 +37,7 @@ from PowerPlatform.Dataverse.data._batch import (
 )
 from PowerPlatform.Dataverse.core.errors import HttpError, MetadataError, ValidationError
 from PowerPlatform.Dataverse.models.upsert import UpsertItem
+from PowerPlatform.Dataverse.data._odata_base import _ODataBase
 from PowerPlatform.Dataverse.data._raw_request import _RawRequest
 
 
@@ -509,6 +510,63 @@ class TestContinueOnError(unittest.TestCase):
         self.assertNotIn("Prefer", kwargs.get("headers", {}))
 
 
+class TestTableCreateClearsEntitySetMiss(unittest.TestCase):
+    """execute() forgets cached "table not found" lookups for tables the batch created."""
+
+    def setUp(self):
+        self.od = _make_od()
+        self.od._normalize_cache_key = _ODataBase._normalize_cache_key
+        self.od._entityset_miss_cache = {"new_widget": 0.0, "account": 0.0}
+        self.od._build_create_entity.return_value = _RawRequest(method="POST", url="https://x/EntityDefinitions")
+        mock_resp = MagicMock()
+        mock_resp.headers = {"Content-Type": 'multipart/mixed; boundary="batch_x"'}
+        mock_resp.status_code = 200
+        mock_resp.text = "--batch_x\r\n\r\nHTTP/1.1 204 No Content\r\n\r\n\r\n--batch_x--"
+        self.od._request.return_value = mock_resp
+        self.client = _BatchClient(self.od)
+
+    def test_created_table_miss_is_cleared(self):
+        """A table created in the batch no longer fails fast on the next lookup."""
+        self.client.execute([_TableCreate(table="new_Widget", columns={"new_name": "string"})])
+        self.assertEqual(self.od._entityset_miss_cache, {"account": 0.0})
+
+    def test_top_level_error_keeps_miss(self):
+        """Nothing is forgotten when the batch itself is rejected."""
+        self.od._request.side_effect = HttpError("boom", status_code=500)
+        with self.assertRaises(HttpError):
+            self.client.execute([_TableCreate(table="new_Widget", columns={"new_name": "string"})])
+        self.assertIn("new_widget", self.od._entityset_miss_cache)
+
+
+class TestPrefetchRecordTables(unittest.TestCase):
+    """execute() resolves the entity sets of multi-table batches up front."""
+
+    def setUp(self):
+        self.od = _make_od()
+        self.od._normalize_cache_key = _ODataBase._normalize_cache_key
+        self.od._build_get.return_value = _RawRequest(method="GET", url="https://x/accounts(g)")
+        self.od._build_create.return_value = _RawRequest(method="POST", url="https://x/contacts")
+        self.od._entity_set_from_schema_name.return_value = "contacts"
+        mock_resp = MagicMock()
+        mock_resp.headers = {"Content-Type": 'multipart/mixed; boundary="batch_x"'}
+        mock_resp.status_code = 200
+        mock_resp.text = "--batch_x\r\n\r\nHTTP/1.1 204 No Content\r\n\r\n\r\n--batch_x--"
+        self.od._request.return_value = mock_resp
+        self.client = _BatchClient(self.od)
+
+    def test_tables_across_items_and_changesets_prefetched_once(self):
+        cs = _ChangeSet()
+        cs.add_create("contact", {"firstname": "A"})
+        self.client.execute([_RecordGet(table="account", record_id="guid-1"), cs])
+        self.od._prefetch_entity_metadata.assert_called_once_with(["account", "contact"])
+
+    def test_single_table_batch_skips_prefetch(self):
+        self.client.execute(
+            [_RecordGet(table="account", record_id="guid-1"), _RecordGet(table="Account", record_id="guid-2")]
+        )
+        self.od._prefetch_entity_metadata.assert_not_called()
+
+
 class TestChangeSetInternal(unittest.TestCase):
     def test_add_create_returns_dollar_n(self):
         cs = _ChangeSet()
@@ -1,7 +1,10 @@
 # Copyright (c) Microsoft Corporation.
 # Licensed under the MIT license.
 
-import types
+from collections import deque
+from dataclasses import dataclass
+from typing import Any
+
 import pytest
 from PowerPlatform.Dataverse.data._odata import _ODataClient
 from PowerPlatform.Dataverse.core.errors import MetadataError
@@ -15,32 +18,39 @@ class DummyAuth:
         return T()
 
 
+@dataclass(slots=True)
+class FakeResponse:
+    status_code: int
+    headers: dict
+    text: str
+    body: Any
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+        return None
+
+    def json(self):
+        return self.body if isinstance(self.body, dict) else {}
+
+
+def _make_response(status, headers, body):
+    text = "" if body is None else ("{}" if isinstance(body, dict) else str(body))
+    return FakeResponse(status, headers, text, body)
+
+
 class DummyHTTPClient:
+    __slots__ = ("_responses", "calls")
+
     def __init__(self, responses):
-        self._responses = responses
+        self._responses = deque(_make_response(*spec) for spec in responses)
         self.calls = []
 
     def _request(self, method, url, **kwargs):
         self.calls.append((method, url, kwargs))
         if not self._responses:
             raise AssertionError("No more dummy responses configured")
-        status, headers, body = self._responses.pop(0)
-        resp = types.SimpleNamespace()
-        resp.status_code = status
-        resp.headers = headers
-        resp.text = "" if body is None else ("{}" if isinstance(body, dict) else str(body))
-
-        def raise_for_status():
-            if status >= 400:
-                raise RuntimeError(f"HTTP {status}")
-            return None
-
-        def json_func():
-            return body if isinstance(body, dict) else {}
-
-        resp.raise_for_status = raise_for_status
-        resp.json = json_func
-        return resp
+        return self._responses.popleft()
 
 
 class MockableClient(_ODataClient):
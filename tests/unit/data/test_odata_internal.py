@@ -7,8 +7,11 @@ import unittest
 from enum import Enum
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from PowerPlatform.Dataverse.core.errors import HttpError, MetadataError, ValidationError
 from PowerPlatform.Dataverse.data._odata import _ODataClient
+from PowerPlatform.Dataverse.data._odata_base import _LRUDict
 
 
 def _make_odata_client() -> _ODataClient:
@@ -30,6 +33,18 @@ def _mock_response(json_data=None, text="", status_code=200, headers=None):
     return response
 
 
+class _FakeResp:
+    """Minimal response stand-in for paths that only pass the response through or call ``json()``."""
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data):
+        self._data = data
+
+    def json(self):
+        return self._data
+
+
 def _entity_def_response(entity_set_name="accounts", primary_id="accountid", metadata_id="meta-001"):
     """Simulate a successful EntityDefinitions response."""
     return _mock_response(
@@ -312,6 +327,17 @@ class TestListTables(unittest.TestCase):
         self.assertIn("list of property names", str(ctx.exception))
 
 
+# (header name, header value, GUID expected from _create), materialized once at import.
+_ENTITY_ID_HEADER_CASES = tuple(
+    (header, f"https://example.crm.dynamics.com/api/data/v9.2/accounts({guid})", guid)
+    for header, guid in (
+        ("OData-EntityId", "00000000-0000-0000-0000-000000000001"),
+        ("OData-EntityID", "00000000-0000-0000-0000-000000000002"),
+        ("Location", "00000000-0000-0000-0000-000000000003"),
+    )
+)
+
+
 class TestCreate(unittest.TestCase):
     """Unit tests for _ODataClient._create."""
 
@@ -319,9 +345,8 @@ class TestCreate(unittest.TestCase):
         self.od = _make_odata_client()
         # Mock response with OData-EntityId header containing a GUID
         mock_resp = MagicMock()
-        mock_resp.headers = {
-            "OData-EntityId": "https://example.crm.dynamics.com/api/data/v9.2/accounts(00000000-0000-0000-0000-000000000001)"
-        }
+        header, value, _ = _ENTITY_ID_HEADER_CASES[0]
+        mock_resp.headers = {header: value}
         self.od._request.return_value = mock_resp
 
     def _post_call(self):
@@ -359,30 +384,13 @@ class TestCreate(unittest.TestCase):
         self.assertNotIn("new_customerid@odata.bind", payload)
         self.assertNotIn("new_agentid@odata.bind", payload)
 
-    def test_returns_guid_from_odata_entity_id(self):
-        """_create returns the GUID from the OData-EntityId header."""
-        result = self.od._create("accounts", "account", {"name": "Contoso"})
-        self.assertEqual(result, "00000000-0000-0000-0000-000000000001")
-
-    def test_returns_guid_from_odata_entity_id_uppercase(self):
-        """_create returns the GUID from the OData-EntityID header (uppercase D)."""
-        mock_resp = MagicMock()
-        mock_resp.headers = {
-            "OData-EntityID": "https://example.crm.dynamics.com/api/data/v9.2/accounts(00000000-0000-0000-0000-000000000002)"
-        }
-        self.od._request.return_value = mock_resp
-        result = self.od._create("accounts", "account", {"name": "Contoso"})
-        self.assertEqual(result, "00000000-0000-0000-0000-000000000002")
-
-    def test_returns_guid_from_location_header_fallback(self):
-        """_create falls back to Location header when OData-EntityId is absent."""
-        mock_resp = MagicMock()
-        mock_resp.headers = {
-            "Location": "https://example.crm.dynamics.com/api/data/v9.2/accounts(00000000-0000-0000-0000-000000000003)"
-        }
-        self.od._request.return_value = mock_resp
-        result = self.od._create("accounts", "account", {"name": "Contoso"})
-        self.assertEqual(result, "00000000-0000-0000-0000-000000000003")
+    def test_returns_guid_from_entity_id_headers(self):
+        """_create returns the GUID from OData-EntityId, OData-EntityID, or the Location fallback."""
+        for header, value, guid in _ENTITY_ID_HEADER_CASES:
+            with self.subTest(header=header):
+                self.od._request.return_value.headers = {header: value}
+                result = self.od._create("accounts", "account", {"name": "Contoso"})
+                self.assertEqual(result, guid)
 
     def test_raises_runtime_error_when_no_guid_in_headers(self):
         """_create raises RuntimeError when neither header contains a GUID."""
@@ -552,6 +560,45 @@ class TestUpsert(unittest.TestCase):
         self.assertIsNone(result)
 
 
+class TestLRUDict(unittest.TestCase):
+    """Unit tests for the bounded _LRUDict metadata cache."""
+
+    def test_evicts_least_recently_used(self):
+        """Inserting past maxsize evicts the entry used longest ago."""
+        cache = _LRUDict(maxsize=2)
+        cache["a"] = 1
+        cache["b"] = 2
+        self.assertEqual(cache.get("a"), 1)
+        cache["c"] = 3
+        self.assertEqual(list(cache), ["a", "c"])
+
+    def test_get_missing_returns_default(self):
+        """get() on a missing key returns the default without inserting it."""
+        cache = _LRUDict(maxsize=2)
+        self.assertIsNone(cache.get("missing"))
+        self.assertEqual(cache.get("missing", 0), 0)
+        self.assertEqual(len(cache), 0)
+
+    def test_get_returns_default_when_key_vanishes_mid_lookup(self):
+        """get() never raises KeyError, even if the key is evicted while it is being read."""
+        cache = _LRUDict(maxsize=2)
+        cache["a"] = 1
+        with patch.object(_LRUDict, "move_to_end", side_effect=KeyError("a")):
+            self.assertEqual(cache.get("a", "default"), "default")
+
+    def test_metadata_caches_are_bounded(self):
+        """The client's metadata caches are all _LRUDict instances."""
+        od = _make_odata_client()
+        for name in (
+            "_logical_to_entityset_cache",
+            "_logical_primaryid_cache",
+            "_entityset_miss_cache",
+            "_picklist_label_cache",
+        ):
+            with self.subTest(cache=name):
+                self.assertIsInstance(getattr(od, name), _LRUDict)
+
+
 class TestStaticHelpers(unittest.TestCase):
     """Unit tests for _ODataClient static helper methods."""
 
@@ -560,6 +607,12 @@ class TestStaticHelpers(unittest.TestCase):
         self.assertEqual(_ODataClient._normalize_cache_key(None), "")
         self.assertEqual(_ODataClient._normalize_cache_key(42), "")
 
+    def test_normalize_cache_key_lowercases(self):
+        """_normalize_cache_key lowercases and returns the same string object on repeat calls."""
+        first = _ODataClient._normalize_cache_key("New_SampleItem")
+        self.assertEqual(first, "new_sampleitem")
+        self.assertIs(_ODataClient._normalize_cache_key("New_SampleItem"), first)
+
     def test_lowercase_list_none_returns_none(self):
         """_lowercase_list(None) returns None."""
         self.assertIsNone(_ODataClient._lowercase_list(None))
@@ -594,6 +647,37 @@ class TestStaticHelpers(unittest.TestCase):
         self.assertEqual(client._to_pascal("hello_world"), "HelloWorld")
         self.assertEqual(client._to_pascal("my_table_name"), "MyTableName")
         self.assertEqual(client._to_pascal("single"), "Single")
+        self.assertEqual(client._to_pascal("new-sample.item"), "NewSampleItem")
+
+
+class TestHeaders(unittest.TestCase):
+    """Unit tests for _ODataClient._headers / _merge_headers."""
+
+    def setUp(self):
+        self.auth = MagicMock()
+        self.auth._acquire_token.return_value = MagicMock(access_token="token")
+        self.od = _ODataClient(self.auth, "https://example.crm.dynamics.com")
+
+    def test_headers_use_current_token(self):
+        """Each call acquires a token for the org scope and places it first."""
+        self.assertEqual(next(iter(self.od._headers().items())), ("Authorization", "Bearer token"))
+        self.auth._acquire_token.return_value = MagicMock(access_token="rotated")
+        self.assertEqual(self.od._headers()["Authorization"], "Bearer rotated")
+        self.auth._acquire_token.assert_called_with("https://example.crm.dynamics.com/.default")
+
+    def test_headers_returns_fresh_dict(self):
+        """Mutating a returned dict must not leak into later requests."""
+        first = self.od._headers()
+        first["Accept"] = "text/plain"
+        self.assertEqual(self.od._headers()["Accept"], "application/json")
+
+    def test_merge_headers_overrides_without_touching_static_headers(self):
+        """Caller headers override defaults for that request only."""
+        merged = self.od._merge_headers({"Content-Type": "application/xml", "If-Match": "*"})
+        self.assertEqual(merged["Content-Type"], "application/xml")
+        self.assertEqual(merged["If-Match"], "*")
+        self.assertEqual(self.od._merge_headers()["Content-Type"], "application/json")
+        self.assertNotIn("If-Match", self.od._merge_headers())
 
 
 class TestRequestErrorParsing(unittest.TestCase):
@@ -761,6 +845,26 @@ class TestPrimaryIdAttr(unittest.TestCase):
         self.assertEqual(result, "accountid")
         self.od._request.assert_not_called()
 
+    def test_primary_id_evicted_before_entity_set_is_refetched(self):
+        """An entity set that outlives its primary id in the LRU caches does not hide the refetch."""
+        self.od._logical_to_entityset_cache = _LRUDict(maxsize=2)
+        self.od._logical_primaryid_cache = _LRUDict(maxsize=2)
+
+        def side_effect(method, url, **kwargs):
+            name = url.split("LogicalName='")[1].split("'")[0]
+            return _mock_response(
+                json_data={"LogicalName": name, "EntitySetName": f"{name}s", "PrimaryIdAttribute": f"{name}id"},
+                text="...",
+            )
+
+        self.od._request.side_effect = side_effect
+        self.od._primary_id_attr("a")
+        self.od._primary_id_attr("b")
+        self.od._entity_set_from_schema_name("a")
+        self.od._primary_id_attr("c")
+        self.assertEqual(self.od._primary_id_attr("a"), "aid")
+        self.assertEqual(self.od._entity_set_from_schema_name("a"), "as")
+
 
 class TestUpdateByIds(unittest.TestCase):
     """Unit tests for _ODataClient._update_by_ids."""
@@ -1217,6 +1321,36 @@ class TestEntitySetFromSchemaName(unittest.TestCase):
         self.assertEqual(result, "accounts")
         self.assertEqual(self.od._logical_to_entityset_cache["account"], "accounts")
 
+    def test_requests_entity_definition_by_key(self):
+        """The lookup navigates to EntityDefinitions(LogicalName='...') with the normalized name."""
+        self.od._request.return_value = _entity_def_response()
+        self.od._entity_set_from_schema_name("Account")
+        self.assertEqual(self.od._request.call_args.args[1], f"{self.od.api}/EntityDefinitions(LogicalName='account')")
+        self.assertNotIn("$filter", self.od._request.call_args.kwargs["params"])
+
+    def test_single_object_body_resolves(self):
+        """A keyed lookup body (single definition object, no value wrapper) resolves the entity set."""
+        self.od._request.return_value = _mock_response(
+            json_data={"LogicalName": "account", "EntitySetName": "accounts", "PrimaryIdAttribute": "accountid"},
+            text="...",
+        )
+        self.assertEqual(self.od._entity_set_from_schema_name("account"), "accounts")
+        self.assertEqual(self.od._logical_primaryid_cache["account"], "accountid")
+
+    def test_404_raises_metadata_error(self):
+        """A 404 from the keyed lookup is reported as an unknown table."""
+        self.od._request.side_effect = HttpError("Not Found", status_code=404)
+        with self.assertRaises(MetadataError):
+            self.od._entity_set_from_schema_name("new_missing")
+        self.assertIn("new_missing", self.od._entityset_miss_cache)
+
+    def test_non_404_http_error_propagates(self):
+        """Other HTTP errors from the lookup are not treated as a missing table."""
+        self.od._request.side_effect = HttpError("Server Error", status_code=500)
+        with self.assertRaises(HttpError):
+            self.od._entity_set_from_schema_name("account")
+        self.assertNotIn("account", self.od._entityset_miss_cache)
+
     def test_success_populates_primaryid_cache(self):
         """Successful API response populates _logical_primaryid_cache."""
         self.od._request.return_value = _entity_def_response(entity_set_name="accounts", primary_id="accountid")
@@ -1232,6 +1366,76 @@ class TestEntitySetFromSchemaName(unittest.TestCase):
         self.od._entity_set_from_schema_name("account")
         self.assertNotIn("account", self.od._logical_primaryid_cache)
 
+    def test_miss_is_cached_and_skips_repeat_request(self):
+        """A 'not found' result is remembered, so a repeat lookup raises without HTTP."""
+        self.od._request.return_value = _mock_response(json_data={"value": []}, text="{}")
+        with self.assertRaises(MetadataError):
+            self.od._entity_set_from_schema_name("new_Typo")
+        with self.assertRaises(MetadataError) as ctx:
+            self.od._entity_set_from_schema_name("NEW_TYPO")
+        self.assertEqual(self.od._request.call_count, 1)
+        self.assertIn("NEW_TYPO", str(ctx.exception))
+
+    def test_expired_miss_is_looked_up_again(self):
+        """A cached miss older than the TTL is retried against the server."""
+        self.od._entityset_miss_cache["account"] = time.time() - self.od._entityset_miss_ttl_seconds - 1
+        self.od._request.return_value = _entity_def_response(entity_set_name="accounts", primary_id="accountid")
+        self.assertEqual(self.od._entity_set_from_schema_name("account"), "accounts")
+        self.assertNotIn("account", self.od._entityset_miss_cache)
+
+    def test_create_entity_clears_cached_miss(self):
+        """Creating a table drops any cached miss for that name."""
+        self.od._entityset_miss_cache["new_testtable"] = time.time()
+        self.od._request.return_value = _entity_def_response(entity_set_name="new_testtables")
+        self.od._create_entity("new_TestTable", "Test Table", [])
+        self.assertNotIn("new_testtable", self.od._entityset_miss_cache)
+
+
+class TestPrefetchEntityMetadata(unittest.TestCase):
+    """Unit tests for _ODataClient._prefetch_entity_metadata."""
+
+    def setUp(self):
+        self.od = _make_odata_client()
+
+    def test_single_request_populates_caches(self):
+        """Uncached tables are resolved together and later lookups hit the cache."""
+        self.od._request.return_value = _mock_response(
+            json_data={
+                "value": [
+                    {"LogicalName": "account", "EntitySetName": "accounts", "PrimaryIdAttribute": "accountid"},
+                    {"LogicalName": "contact", "EntitySetName": "contacts", "PrimaryIdAttribute": "contactid"},
+                ]
+            },
+            text="...",
+        )
+        self.od._prefetch_entity_metadata(["Account", "contact", "account"])
+        params = self.od._request.call_args.kwargs["params"]
+        self.assertEqual(params["$filter"], "LogicalName eq 'account' or LogicalName eq 'contact'")
+        self.assertEqual(self.od._entity_set_from_schema_name("Contact"), "contacts")
+        self.assertEqual(self.od._primary_id_attr("account"), "accountid")
+        self.od._request.assert_called_once()
+
+    def test_skips_cached_tables(self):
+        """Only names missing from the entity set cache are requested."""
+        self.od._logical_to_entityset_cache["account"] = "accounts"
+        self.od._request.return_value = _mock_response(json_data={"value": []}, text="{}")
+        self.od._prefetch_entity_metadata(["account", "contact"])
+        self.assertEqual(self.od._request.call_args.kwargs["params"]["$filter"], "LogicalName eq 'contact'")
+
+    def test_all_cached_issues_no_request(self):
+        """No request is made when every table is already cached."""
+        self.od._logical_to_entityset_cache["account"] = "accounts"
+        self.od._prefetch_entity_metadata(["Account"])
+        self.od._request.assert_not_called()
+
+    def test_large_lists_are_requested_in_chunks(self):
+        """Names are OR-ed at most 50 per request so the $filter stays within URL limits."""
+        self.od._request.return_value = _mock_response(json_data={"value": []}, text="{}")
+        self.od._prefetch_entity_metadata([f"new_table{i}" for i in range(120)])
+        filters = [c.kwargs["params"]["$filter"] for c in self.od._request.call_args_list]
+        self.assertEqual([f.count("LogicalName eq") for f in filters], [50, 50, 20])
+        self.assertTrue(filters[2].endswith("LogicalName eq 'new_table119'"))
+
 
 class TestGetEntityByTableSchemaName(unittest.TestCase):
     """Unit tests for _ODataClient._get_entity_by_table_schema_name."""
@@ -1308,7 +1512,57 @@ class TestCreateEntity(unittest.TestCase):
         self._setup_entity_creation()
         self.od._create_entity("new_TestTable", "Test Table", [], solution_unique_name="MySolution")
         post_call = next(c for c in self.od._request.call_args_list if c.args[0] == "post")
-        self.assertEqual(post_call.kwargs.get("params"), {"SolutionUniqueName": "MySolution"})
+        self.assertEqual(post_call.kwargs.get("params")["SolutionUniqueName"], "MySolution")
+
+    def test_post_requests_representation(self):
+        """_create_entity asks the service to echo the created definition."""
+        self._setup_entity_creation()
+        self.od._create_entity("new_TestTable", "Test Table", [])
+        post_call = next(c for c in self.od._request.call_args_list if c.args[0] == "post")
+        self.assertEqual(post_call.kwargs["headers"], {"Prefer": "return=representation"})
+        self.assertIn("EntitySetName", post_call.kwargs["params"]["$select"])
+        self.assertNotIn("SolutionUniqueName", post_call.kwargs["params"])
+
+    def test_echoed_definition_skips_follow_up_get(self):
+        """When the POST echoes the definition, no GET is issued."""
+        created = {"MetadataId": "meta-009", "LogicalName": "new_testtable", "EntitySetName": "new_testtables"}
+        self.od._request.side_effect = None
+        self.od._request.return_value = _mock_response(json_data=created, text="...", status_code=201)
+        result = self.od._create_entity("new_TestTable", "Test Table", [])
+        self.assertEqual(result, created)
+        self.assertEqual([c.args[0] for c in self.od._request.call_args_list], ["post"])
+
+    def test_empty_post_body_falls_back_to_get(self):
+        """A 204-style empty POST response falls back to the Consistency: Strong lookup."""
+        self._setup_entity_creation()
+        self.od._create_entity("new_TestTable", "Test Table", [])
+        get_call = next(c for c in self.od._request.call_args_list if c.args[0] == "get")
+        self.assertEqual(get_call.kwargs["headers"], {"Consistency": "Strong"})
+
+    def test_echoed_definition_seeds_entity_caches(self):
+        """Records calls after create resolve the new table without a metadata request."""
+        created = {
+            "MetadataId": "meta-009",
+            "LogicalName": "new_testtable",
+            "EntitySetName": "new_testtables",
+            "PrimaryIdAttribute": "new_testtableid",
+        }
+        self.od._request.side_effect = None
+        self.od._request.return_value = _mock_response(json_data=created, text="...", status_code=201)
+        self.od._create_entity("new_TestTable", "Test Table", [])
+        self.od._request.reset_mock()
+        self.assertEqual(self.od._entity_set_from_schema_name("new_TestTable"), "new_testtables")
+        self.assertEqual(self.od._primary_id_attr("new_TestTable"), "new_testtableid")
+        self.od._request.assert_not_called()
+
+    def test_fallback_get_seeds_entity_caches(self):
+        """The Consistency: Strong read-back also seeds the entity set and primary id caches."""
+        self._setup_entity_creation(get_response=_entity_def_response("new_testtables", "new_testtableid"))
+        self.od._create_entity("new_TestTable", "Test Table", [])
+        self.od._request.reset_mock()
+        self.assertEqual(self.od._entity_set_from_schema_name("new_TestTable"), "new_testtables")
+        self.assertEqual(self.od._primary_id_attr("new_TestTable"), "new_testtableid")
+        self.od._request.assert_not_called()
 
 
 class TestGetAttributeMetadata(unittest.TestCase):
@@ -1366,6 +1620,83 @@ class TestGetAttributeMetadata(unittest.TestCase):
         self.assertIsNone(result)
 
 
+class TestGetEntityWithAttribute(unittest.TestCase):
+    """Unit tests for _ODataClient._get_entity_with_attribute."""
+
+    def setUp(self):
+        self.od = _make_odata_client()
+
+    def test_single_request_with_expanded_attribute(self):
+        """Entity and attribute are fetched in one request via $expand."""
+        self.od._request.return_value = _mock_response(
+            json_data={
+                "value": [
+                    {
+                        "MetadataId": "meta-001",
+                        "LogicalName": "account",
+                        "Attributes": [{"MetadataId": "attr-001", "LogicalName": "new_doc"}],
+                    }
+                ]
+            },
+            text="...",
+        )
+        ent, attr = self.od._get_entity_with_attribute("Account", "new_Doc", extra_select="AttributeType")
+        self.assertEqual(ent, {"MetadataId": "meta-001", "LogicalName": "account"})
+        self.assertEqual(attr["MetadataId"], "attr-001")
+        self.od._request.assert_called_once()
+        self.assertEqual(self.od._request.call_args.args[1], f"{self.od.api}/EntityDefinitions(LogicalName='account')")
+        params = self.od._request.call_args.kwargs["params"]
+        self.assertEqual(
+            params["$expand"],
+            "Attributes($select=MetadataId,LogicalName,SchemaName,AttributeType;$filter=LogicalName eq 'new_doc')",
+        )
+
+    def test_missing_attribute_returns_none(self):
+        """An empty expanded Attributes collection yields (entity, None)."""
+        self.od._request.return_value = _mock_response(
+            json_data={"value": [{"MetadataId": "meta-001", "Attributes": []}]}, text="..."
+        )
+        ent, attr = self.od._get_entity_with_attribute("account", "new_missing")
+        self.assertEqual(ent["MetadataId"], "meta-001")
+        self.assertIsNone(attr)
+
+    def test_multiple_columns_in_one_expand(self):
+        """Several columns are OR-ed into one expand filter and keyed by lowercase logical name."""
+        self.od._request.return_value = _mock_response(
+            json_data={
+                "MetadataId": "meta-001",
+                "Attributes": [
+                    {"MetadataId": "attr-a", "LogicalName": "new_a"},
+                    {"MetadataId": "attr-b", "LogicalName": "new_b"},
+                ],
+            },
+            text="...",
+        )
+        ent, attrs = self.od._get_entity_with_attributes("account", ["new_A", "new_B", "new_a"])
+        self.assertEqual(ent, {"MetadataId": "meta-001"})
+        self.assertEqual(set(attrs), {"new_a", "new_b"})
+        self.od._request.assert_called_once()
+        expand = self.od._request.call_args.kwargs["params"]["$expand"]
+        self.assertTrue(expand.endswith("$filter=LogicalName eq 'new_a' or LogicalName eq 'new_b')"))
+
+    def test_missing_entity_returns_none_pair(self):
+        """No matching entity yields (None, None)."""
+        self.od._request.return_value = _mock_response(json_data={"value": []}, text="{}")
+        self.assertEqual(self.od._get_entity_with_attribute("new_missing", "new_col"), (None, None))
+
+    def test_no_columns_skips_attribute_expand(self):
+        """An empty column list looks up the table only; no empty $filter= is sent."""
+        self.od._request.return_value = _mock_response(
+            json_data={"MetadataId": "meta-001", "SchemaName": "Account"}, text="..."
+        )
+        self.assertEqual(self.od._delete_columns("account", []), [])
+        self.od._request.assert_called_once()
+        params = self.od._request.call_args.kwargs["params"]
+        self.assertNotIn("$expand", params)
+        self.assertNotIn("$filter=", str(params))
+
+
+@pytest.mark.usefixtures("bind_sleep_calls")
 class TestWaitForAttributeVisibility(unittest.TestCase):
     """Unit tests for _ODataClient._wait_for_attribute_visibility."""
 
@@ -1387,9 +1718,8 @@ class TestWaitForAttributeVisibility(unittest.TestCase):
     def test_sleep_is_called_for_nonzero_delays(self):
         """_wait_for_attribute_visibility calls time.sleep for non-zero delays."""
         self.od._request.side_effect = [RuntimeError("not ready"), _mock_response()]
-        with patch("PowerPlatform.Dataverse.data._odata.time.sleep") as mock_sleep:
-            self.od._wait_for_attribute_visibility("accounts", "name", delays=(0, 5))
-        mock_sleep.assert_called_once_with(5)
+        self.od._wait_for_attribute_visibility("accounts", "name", delays=(0, 5))
+        self.assertEqual(self.sleep_calls, [5])
 
     def test_raises_runtime_error_after_all_retries_exhausted(self):
         """_wait_for_attribute_visibility raises RuntimeError when all retries fail."""
@@ -1922,14 +2252,22 @@ class TestDeleteColumns(unittest.TestCase):
 
     def setUp(self):
         self.od = _make_odata_client()
-        self.od._get_entity_by_table_schema_name = MagicMock(
-            return_value={"MetadataId": "meta-001", "SchemaName": "new_Test"}
-        )
-        self.od._get_attribute_metadata = MagicMock(
-            return_value={"MetadataId": "attr-001", "LogicalName": "new_name", "@odata.type": "StringAttributeMetadata"}
+        self._stub_metadata(
+            {"MetadataId": "attr-001", "LogicalName": "new_name", "@odata.type": "StringAttributeMetadata"}
         )
         self.od._request.return_value = _mock_response(status_code=204)
 
+    def _stub_metadata(self, attr_meta, entity=None):
+        """Stub the single table+columns lookup; every requested column resolves to ``attr_meta``."""
+        entity = entity if entity is not None else {"MetadataId": "meta-001", "SchemaName": "new_Test"}
+
+        def lookup(table_schema_name, column_names, extra_select=None):
+            if not entity:
+                return None, {}
+            return entity, {n.lower(): attr_meta for n in column_names} if attr_meta else {}
+
+        self.od._get_entity_with_attributes = MagicMock(side_effect=lookup)
+
     def test_deletes_single_column(self):
         """_delete_columns accepts a string column name and issues DELETE."""
         result = self.od._delete_columns("new_Test", "new_Name")
@@ -1944,6 +2282,9 @@ class TestDeleteColumns(unittest.TestCase):
         self.assertEqual(len(result), 2)
         delete_calls = [c for c in self.od._request.call_args_list if c.args[0] == "delete"]
         self.assertEqual(len(delete_calls), 2)
+        self.od._get_entity_with_attributes.assert_called_once_with(
+            "new_Test", ["new_Name1", "new_Name2"], extra_select="AttributeType"
+        )
 
     def test_non_string_non_list_raises_type_error(self):
         """_delete_columns raises TypeError for invalid columns type."""
@@ -1957,28 +2298,28 @@ class TestDeleteColumns(unittest.TestCase):
 
     def test_table_not_found_raises_metadata_error(self):
         """_delete_columns raises MetadataError when table not found."""
-        self.od._get_entity_by_table_schema_name = MagicMock(return_value=None)
+        self._stub_metadata(None, entity={})
         with self.assertRaises(MetadataError):
             self.od._delete_columns("new_NonExistent", "new_Col")
 
     def test_column_not_found_raises_metadata_error(self):
         """_delete_columns raises MetadataError when column not found."""
-        self.od._get_attribute_metadata = MagicMock(return_value=None)
+        self._stub_metadata(None)
         with self.assertRaises(MetadataError) as ctx:
             self.od._delete_columns("new_Test", "new_Missing")
         self.assertIn("not found", str(ctx.exception))
 
     def test_missing_metadata_id_raises_runtime_error(self):
         """_delete_columns raises RuntimeError when column MetadataId is missing."""
-        self.od._get_attribute_metadata = MagicMock(return_value={"LogicalName": "new_name"})
+        self._stub_metadata({"LogicalName": "new_name"})
         with self.assertRaises(RuntimeError) as ctx:
             self.od._delete_columns("new_Test", "new_Name")
         self.assertIn("MetadataId", str(ctx.exception))
 
     def test_picklist_column_deletion_flushes_cache(self):
         """_delete_columns flushes picklist cache when a picklist column is deleted."""
-        self.od._get_attribute_metadata = MagicMock(
-            return_value={
+        self._stub_metadata(
+            {
                 "MetadataId": "attr-001",
                 "LogicalName": "new_status",
                 "@odata.type": "PicklistAttributeMetadata",
@@ -2006,10 +2347,20 @@ class TestFlushCache(unittest.TestCase):
         """_flush_cache returns 0 when cache is already empty."""
         self.assertEqual(self.od._flush_cache("picklist"), 0)
 
+    def test_flush_entityset_clears_metadata_caches(self):
+        """_flush_cache('entityset') clears entity set, primary id and miss caches."""
+        self.od._logical_to_entityset_cache["account"] = "accounts"
+        self.od._logical_primaryid_cache["account"] = "accountid"
+        self.od._entityset_miss_cache["new_missing"] = time.time()
+        self.assertEqual(self.od._flush_cache("EntitySet"), 3)
+        self.assertEqual(len(self.od._logical_to_entityset_cache), 0)
+        self.assertEqual(len(self.od._logical_primaryid_cache), 0)
+        self.assertEqual(len(self.od._entityset_miss_cache), 0)
+
     def test_unsupported_cache_kind_raises_validation_error(self):
         """_flush_cache raises ValidationError for unsupported kind."""
         with self.assertRaises(ValidationError):
-            self.od._flush_cache("entityset")
+            self.od._flush_cache("primaryid")
 
     def test_none_kind_raises_validation_error(self):
         """_flush_cache raises ValidationError for None kind."""
@@ -2017,6 +2368,7 @@ class TestFlushCache(unittest.TestCase):
             self.od._flush_cache(None)
 
 
+@pytest.mark.usefixtures("bind_sleep_calls")
 class TestPicklistLabelResolution(unittest.TestCase):
     """Tests for picklist label-to-integer resolution.
 
@@ -2175,29 +2527,27 @@ class TestPicklistLabelResolution(unittest.TestCase):
 
     def test_retry_succeeds_on_first_try(self):
         """No retry needed when first call succeeds."""
-        mock_resp = MagicMock()
+        mock_resp = _FakeResp({"value": []})
         self.od._request.return_value = mock_resp
 
         result = self.od._request_metadata_with_retry("get", "https://example.com/test")
         self.assertIs(result, mock_resp)
         self.assertEqual(self.od._request.call_count, 1)
 
-    @patch("PowerPlatform.Dataverse.data._odata.time.sleep")
-    def test_retry_retries_on_404(self, mock_sleep):
+    def test_retry_retries_on_404(self):
         """Should retry on 404 and succeed on later attempt."""
         from PowerPlatform.Dataverse.core.errors import HttpError
 
         err_404 = HttpError("Not Found", status_code=404)
-        mock_resp = MagicMock()
+        mock_resp = _FakeResp({"value": []})
         self.od._request.side_effect = [err_404, mock_resp]
 
         result = self.od._request_metadata_with_retry("get", "https://example.com/test")
         self.assertIs(result, mock_resp)
         self.assertEqual(self.od._request.call_count, 2)
-        mock_sleep.assert_called_once()
+        self.assertEqual(self.sleep_calls, [0.4])
 
-    @patch("PowerPlatform.Dataverse.data._odata.time.sleep")
-    def test_retry_raises_after_max_attempts(self, mock_sleep):
+    def test_retry_raises_after_max_attempts(self):
         """Should raise RuntimeError after all retries exhausted."""
         from PowerPlatform.Dataverse.core.errors import HttpError
 
@@ -2207,7 +2557,8 @@ class TestPicklistLabelResolution(unittest.TestCase):
         with self.assertRaises(RuntimeError) as ctx:
             self.od._request_metadata_with_retry("get", "https://example.com/test")
         self.assertIn("404", str(ctx.exception))
-        self.assertTrue(mock_sleep.called)
+        self.assertEqual(self.od._request.call_count, 5)
+        self.assertEqual(self.sleep_calls, [0.4, 0.8, 1.6, 3.2])
 
     def test_retry_does_not_retry_non_404(self):
         """Non-404 errors should be raised immediately without retry."""
@@ -3,515 +3,484 @@
 
 """Tests for relationship metadata operations."""
 
-import unittest
-from unittest.mock import MagicMock, Mock
+import re
+from types import MappingProxyType
+from unittest.mock import patch
 
+import pytest
+
+from PowerPlatform.Dataverse.core.errors import MetadataError
+from PowerPlatform.Dataverse.data import _relationships
+from PowerPlatform.Dataverse.data._odata_base import _ODataBase
 from PowerPlatform.Dataverse.data._relationships import _RelationshipOperationsMixin
 from PowerPlatform.Dataverse.models.relationship import (
-    LookupAttributeMetadata,
     OneToManyRelationshipMetadata,
     ManyToManyRelationshipMetadata,
 )
-from PowerPlatform.Dataverse.models.labels import Label, LocalizedLabel
 
+_API_BASE = "https://example.crm.dynamics.com/api/data/v9.2"
+_RELATIONSHIP_DEFINITIONS_URL = f"{_API_BASE}/RelationshipDefinitions"
+_ONE_TO_MANY_ID = "12345678-1234-1234-1234-123456789abc"
+_M2M_ID = "abcd1234-abcd-1234-abcd-1234abcd5678"
+_ONE_TO_MANY_ENTITY_ID = f"{_RELATIONSHIP_DEFINITIONS_URL}({_ONE_TO_MANY_ID})"
+
+
+class MockODataClient(_RelationshipOperationsMixin):
+    """Mock client that inherits from mixin for integration testing.
 
-class TestExtractIdFromHeader(unittest.TestCase):
-    """Tests for _extract_id_from_header method."""
+    ``_request`` records ``(method, url, kwargs)`` in ``calls`` and returns the
+    next queued entry from ``responses``, falling back to ``response``.
+    """
 
-    def setUp(self):
-        """Create a minimal mixin instance for testing."""
-        self.mixin = _RelationshipOperationsMixin()
+    __slots__ = ("api", "calls", "responses", "response", "_mock_headers")
 
-    def test_extract_id_from_standard_header(self):
-        """Test extracting GUID from standard OData-EntityId header."""
-        header = "https://example.crm.dynamics.com/api/data/v9.2/RelationshipDefinitions(12345678-1234-1234-1234-123456789abc)"
-        result = self.mixin._extract_id_from_header(header)
-        self.assertEqual(result, "12345678-1234-1234-1234-123456789abc")
+    def __init__(self, api_base: str):
+        self.api = api_base
+        self.calls = []
+        self.responses = []
+        self.response = None
+        self._mock_headers = MappingProxyType({"Authorization": "Bearer test-token"})
 
-    def test_extract_id_from_header_uppercase_guid(self):
-        """Test extracting uppercase GUID."""
-        header = "https://example.crm.dynamics.com/api/data/v9.2/RelationshipDefinitions(ABCDEF12-3456-7890-ABCD-EF1234567890)"
-        result = self.mixin._extract_id_from_header(header)
-        self.assertEqual(result, "ABCDEF12-3456-7890-ABCD-EF1234567890")
+    def _headers(self):
+        # Read-only view: the mixin must copy before adding per-request headers
+        return self._mock_headers
 
-    def test_extract_id_from_none_header(self):
-        """Test that None header returns None."""
-        result = self.mixin._extract_id_from_header(None)
-        self.assertIsNone(result)
+    def _request(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs))
+        return self.responses.pop(0) if self.responses else self.response
 
-    def test_extract_id_from_empty_header(self):
-        """Test that empty header returns None."""
-        result = self.mixin._extract_id_from_header("")
-        self.assertIsNone(result)
+    # Same escaping the real client uses, rather than a hand-copied version
+    _escape_odata_quotes = staticmethod(_ODataBase._escape_odata_quotes)
 
-    def test_extract_id_from_header_without_guid(self):
-        """Test that header without GUID returns None."""
-        header = "https://example.crm.dynamics.com/api/data/v9.2/RelationshipDefinitions"
-        result = self.mixin._extract_id_from_header(header)
-        self.assertIsNone(result)
 
+class MockODataClientWithEntityLookup(MockODataClient):
+    """Extended mock client that also supports _get_entity_by_table_schema_name."""
 
-class MockODataClient(_RelationshipOperationsMixin):
-    """Mock client that inherits from mixin for integration testing."""
+    __slots__ = ("entity",)
 
     def __init__(self, api_base: str):
-        self.api = api_base
-        self._mock_request = MagicMock()
-        self._mock_headers = {"Authorization": "Bearer test-token"}
+        super().__init__(api_base)
+        self.entity = None
 
-    def _headers(self):
-        return self._mock_headers.copy()
+    def _get_entity_by_table_schema_name(self, table_schema_name, headers=None):
+        return self.entity
 
-    def _request(self, method, url, **kwargs):
-        return self._mock_request(method, url, **kwargs)
-
-    def _escape_odata_quotes(self, value: str) -> str:
-        """Escape single quotes for OData filter values."""
-        return value.replace("'", "''")
-
-
-class TestCreateOneToManyRelationship(unittest.TestCase):
-    """Tests for _create_one_to_many_relationship method."""
-
-    def setUp(self):
-        """Set up test fixtures."""
-        self.client = MockODataClient("https://example.crm.dynamics.com/api/data/v9.2")
-
-        # Create test metadata objects
-        self.lookup = LookupAttributeMetadata(
-            schema_name="new_AccountId",
-            display_name=Label(localized_labels=[LocalizedLabel(label="Account", language_code=1033)]),
-        )
-        self.relationship = OneToManyRelationshipMetadata(
-            schema_name="new_account_orders",
-            referenced_entity="account",
-            referencing_entity="new_order",
-            referenced_attribute="accountid",
-        )
-
-    def test_create_relationship_url(self):
-        """Test that correct URL is used."""
-        mock_response = Mock()
-        mock_response.headers = {
-            "OData-EntityId": "https://example.crm.dynamics.com/api/data/v9.2/RelationshipDefinitions(12345678-1234-1234-1234-123456789abc)"
-        }
-        self.client._mock_request.return_value = mock_response
-
-        self.client._create_one_to_many_relationship(self.lookup, self.relationship)
-
-        # Verify URL
-        call_args = self.client._mock_request.call_args
-        self.assertEqual(call_args[0][0], "post")
-        self.assertEqual(call_args[0][1], "https://example.crm.dynamics.com/api/data/v9.2/RelationshipDefinitions")
-
-    def test_create_relationship_payload_includes_lookup(self):
-        """Test that payload includes both relationship and lookup metadata."""
-        mock_response = Mock()
-        mock_response.headers = {
-            "OData-EntityId": "https://example.crm.dynamics.com/api/data/v9.2/RelationshipDefinitions(12345678-1234-1234-1234-123456789abc)"
-        }
-        self.client._mock_request.return_value = mock_response
-
-        self.client._create_one_to_many_relationship(self.lookup, self.relationship)
-
-        # Verify payload
-        call_args = self.client._mock_request.call_args
-        payload = call_args[1]["json"]
-        self.assertIn("@odata.type", payload)
-        self.assertEqual(payload["@odata.type"], "Microsoft.Dynamics.CRM.OneToManyRelationshipMetadata")
-        self.assertIn("Lookup", payload)
-        self.assertEqual(payload["Lookup"]["SchemaName"], "new_AccountId")
-
-    def test_create_relationship_with_solution(self):
-        """Test that solution header is added when specified."""
-        mock_response = Mock()
-        mock_response.headers = {
-            "OData-EntityId": "https://example.crm.dynamics.com/api/data/v9.2/RelationshipDefinitions(12345678-1234-1234-1234-123456789abc)"
-        }
-        self.client._mock_request.return_value = mock_response
-
-        self.client._create_one_to_many_relationship(self.lookup, self.relationship, solution="MySolution")
-
-        # Verify solution header
-        call_args = self.client._mock_request.call_args
-        headers = call_args[1]["headers"]
-        self.assertEqual(headers["MSCRM.SolutionUniqueName"], "MySolution")
-
-    def test_create_relationship_returns_result(self):
-        """Test that result dictionary is correctly populated."""
-        mock_response = Mock()
-        mock_response.headers = {
-            "OData-EntityId": "https://example.crm.dynamics.com/api/data/v9.2/RelationshipDefinitions(12345678-1234-1234-1234-123456789abc)"
-        }
-        self.client._mock_request.return_value = mock_response
-
-        result = self.client._create_one_to_many_relationship(self.lookup, self.relationship)
-
-        self.assertEqual(result["relationship_id"], "12345678-1234-1234-1234-123456789abc")
-        self.assertEqual(result["relationship_schema_name"], "new_account_orders")
-        self.assertEqual(result["lookup_schema_name"], "new_AccountId")
-        self.assertEqual(result["referenced_entity"], "account")
-        self.assertEqual(result["referencing_entity"], "new_order")
-
-
-class TestCreateManyToManyRelationship(unittest.TestCase):
-    """Tests for _create_many_to_many_relationship method."""
-
-    def setUp(self):
-        """Set up test fixtures."""
-        self.client = MockODataClient("https://example.crm.dynamics.com/api/data/v9.2")
-
-        self.relationship = ManyToManyRelationshipMetadata(
-            schema_name="new_account_contact",
-            entity1_logical_name="account",
-            entity2_logical_name="contact",
-        )
-
-    def test_create_m2m_relationship_url(self):
-        """Test that correct URL is used."""
-        mock_response = Mock()
-        mock_response.headers = {
-            "OData-EntityId": "https://example.crm.dynamics.com/api/data/v9.2/RelationshipDefinitions(abcd1234-abcd-1234-abcd-1234abcd5678)"
-        }
-        self.client._mock_request.return_value = mock_response
-
-        self.client._create_many_to_many_relationship(self.relationship)
-
-        call_args = self.client._mock_request.call_args
-        self.assertEqual(call_args[0][0], "post")
-        self.assertEqual(call_args[0][1], "https://example.crm.dynamics.com/api/data/v9.2/RelationshipDefinitions")
-
-    def test_create_m2m_relationship_returns_result(self):
-        """Test that result dictionary is correctly populated."""
-        mock_response = Mock()
-        mock_response.headers = {
-            "OData-EntityId": "https://example.crm.dynamics.com/api/data/v9.2/RelationshipDefinitions(abcd1234-abcd-1234-abcd-1234abcd5678)"
-        }
-        self.client._mock_request.return_value = mock_response
-
-        result = self.client._create_many_to_many_relationship(self.relationship)
-
-        self.assertEqual(result["relationship_id"], "abcd1234-abcd-1234-abcd-1234abcd5678")
-        self.assertEqual(result["relationship_schema_name"], "new_account_contact")
-        self.assertEqual(result["entity1_logical_name"], "account")
-        self.assertEqual(result["entity2_logical_name"], "contact")
-
-    def test_create_m2m_relationship_with_solution(self):
-        """Solution name is added as MSCRM.SolutionUniqueName header."""
-        mock_response = Mock()
-        mock_response.headers = {
-            "OData-EntityId": "https://example.crm.dynamics.com/api/data/v9.2/RelationshipDefinitions(abcd1234-abcd-1234-abcd-1234abcd5678)"
-        }
-        self.client._mock_request.return_value = mock_response
-
-        self.client._create_many_to_many_relationship(self.relationship, solution="MySolution")
-
-        headers = self.client._mock_request.call_args.kwargs["headers"]
-        self.assertEqual(headers["MSCRM.SolutionUniqueName"], "MySolution")
-
-
-class TestDeleteRelationship(unittest.TestCase):
-    """Tests for _delete_relationship method."""
-
-    def setUp(self):
-        """Set up test fixtures."""
-        self.client = MockODataClient("https://example.crm.dynamics.com/api/data/v9.2")
-
-    def test_delete_relationship_url(self):
-        """Test that correct URL is constructed."""
-        mock_response = Mock()
-        self.client._mock_request.return_value = mock_response
 
-        self.client._delete_relationship("12345678-1234-1234-1234-123456789abc")
+# ---------------------------------------------------------------------------
+# Fixtures
+#
+# Metadata objects are only read by the code under test, so they are built once
+# per module; the shared ``account_lookup`` comes from ``tests/unit/conftest.py``.
+# Clients carry per-test mock state and stay function-scoped.
+# ---------------------------------------------------------------------------
 
-        call_args = self.client._mock_request.call_args
-        self.assertEqual(call_args[0][0], "delete")
-        self.assertEqual(
-            call_args[0][1],
-            "https://example.crm.dynamics.com/api/data/v9.2/RelationshipDefinitions(12345678-1234-1234-1234-123456789abc)",
-        )
 
-    def test_delete_relationship_has_if_match_header(self):
-        """Test that If-Match header is set."""
-        mock_response = Mock()
-        self.client._mock_request.return_value = mock_response
+@pytest.fixture(scope="module")
+def mixin():
+    """Minimal mixin instance for the pure header-parsing helper."""
+    return _RelationshipOperationsMixin()
 
-        self.client._delete_relationship("12345678-1234-1234-1234-123456789abc")
 
-        call_args = self.client._mock_request.call_args
-        headers = call_args[1]["headers"]
-        self.assertEqual(headers["If-Match"], "*")
+@pytest.fixture(scope="module")
+def one_to_many_rel():
+    return OneToManyRelationshipMetadata(
+        schema_name="new_account_orders",
+        referenced_entity="account",
+        referencing_entity="new_order",
+        referenced_attribute="accountid",
+    )
 
 
-class TestGetRelationship(unittest.TestCase):
-    """Tests for _get_relationship method."""
+@pytest.fixture(scope="module")
+def m2m_rel():
+    return ManyToManyRelationshipMetadata(
+        schema_name="new_account_contact",
+        entity1_logical_name="account",
+        entity2_logical_name="contact",
+    )
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.client = MockODataClient("https://example.crm.dynamics.com/api/data/v9.2")
 
-    def test_get_relationship_url_and_filter(self):
-        """Test that correct URL and filter are used."""
-        mock_response = Mock()
-        mock_response.json.return_value = {"value": []}
-        self.client._mock_request.return_value = mock_response
+@pytest.fixture
+def client():
+    return MockODataClient(_API_BASE)
 
-        self.client._get_relationship("new_account_orders")
 
-        call_args = self.client._mock_request.call_args
-        self.assertEqual(call_args[0][0], "get")
-        self.assertEqual(call_args[0][1], "https://example.crm.dynamics.com/api/data/v9.2/RelationshipDefinitions")
-        self.assertEqual(call_args[1]["params"]["$filter"], "SchemaName eq 'new_account_orders'")
+@pytest.fixture
+def lookup_client():
+    c = MockODataClientWithEntityLookup(_API_BASE)
+    c.entity = {
+        "MetadataId": "ent-guid-1",
+        "LogicalName": "account",
+        "SchemaName": "Account",
+    }
+    return c
 
-    def test_get_relationship_escapes_quotes(self):
-        """Test that single quotes in schema name are escaped."""
-        mock_response = Mock()
-        mock_response.json.return_value = {"value": []}
-        self.client._mock_request.return_value = mock_response
 
-        # Schema names shouldn't have quotes, but test the escaping anyway
-        self.client._get_relationship("schema'name")
+class _FakeResponse:
+    """Minimal response stand-in exposing only ``headers`` and ``json()``."""
 
-        call_args = self.client._mock_request.call_args
-        self.assertEqual(call_args[1]["params"]["$filter"], "SchemaName eq 'schema''name'")
+    __slots__ = ("_payload", "headers")
 
-    def test_get_relationship_returns_first_result(self):
-        """Test that first result is returned when found."""
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "value": [
-                {"SchemaName": "new_account_orders", "MetadataId": "12345"},
-                {"SchemaName": "other", "MetadataId": "67890"},
-            ]
-        }
-        self.client._mock_request.return_value = mock_response
+    def __init__(self, payload=None, headers=None):
+        self._payload = payload
+        self.headers = headers or {}
 
-        result = self.client._get_relationship("new_account_orders")
+    def json(self):
+        return self._payload
 
-        self.assertEqual(result["SchemaName"], "new_account_orders")
-        self.assertEqual(result["MetadataId"], "12345")
 
-    def test_get_relationship_returns_none_when_not_found(self):
-        """Test that None is returned when not found."""
-        mock_response = Mock()
-        mock_response.json.return_value = {"value": []}
-        self.client._mock_request.return_value = mock_response
+def _created_response(relationship_id):
+    """Response stub for a create call: only the ``OData-EntityId`` header is read."""
+    return _FakeResponse(headers={"OData-EntityId": f"{_RELATIONSHIP_DEFINITIONS_URL}({relationship_id})"})
 
-        result = self.client._get_relationship("nonexistent")
 
-        self.assertIsNone(result)
+@pytest.fixture
+def one_to_many_client(client):
+    """Client whose requests answer like a successful one-to-many create."""
+    client.response = _created_response(_ONE_TO_MANY_ID)
+    return client
 
 
-class MockODataClientWithEntityLookup(MockODataClient):
-    """Extended mock client that also supports _get_entity_by_table_schema_name."""
+@pytest.fixture
+def m2m_client(client):
+    """Client whose requests answer like a successful many-to-many create."""
+    client.response = _created_response(_M2M_ID)
+    return client
 
-    def __init__(self, api_base: str):
-        super().__init__(api_base)
-        self._mock_get_entity = MagicMock()
 
-    def _get_entity_by_table_schema_name(self, table_schema_name, headers=None):
-        return self._mock_get_entity(table_schema_name)
+def _make_response(value):
+    return _FakeResponse({"value": value})
 
 
-class TestListRelationships(unittest.TestCase):
-    """Tests for _list_relationships method."""
+# ---------------------------------------------------------------------------
+# _extract_id_from_header
+# ---------------------------------------------------------------------------
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.client = MockODataClient("https://example.crm.dynamics.com/api/data/v9.2")
 
-    def test_list_relationships_url(self):
-        """Test that correct URL is used."""
-        mock_response = Mock()
-        mock_response.json.return_value = {"value": []}
-        self.client._mock_request.return_value = mock_response
+@pytest.mark.parametrize(
+    "header,expected",
+    [
+        pytest.param(
+            _ONE_TO_MANY_ENTITY_ID,
+            _ONE_TO_MANY_ID,
+            id="standard_header",
+        ),
+        pytest.param(
+            f"{_RELATIONSHIP_DEFINITIONS_URL}(ABCDEF12-3456-7890-ABCD-EF1234567890)",
+            "ABCDEF12-3456-7890-ABCD-EF1234567890",
+            id="uppercase_guid",
+        ),
+        pytest.param(None, None, id="none_header"),
+        pytest.param("", None, id="empty_header"),
+        pytest.param(
+            _RELATIONSHIP_DEFINITIONS_URL,
+            None,
+            id="header_without_guid",
+        ),
+    ],
+)
+def test_extract_id_from_header(mixin, header, expected):
+    assert mixin._extract_id_from_header(header) == expected
 
-        self.client._list_relationships()
 
-        call_args = self.client._mock_request.call_args
-        self.assertEqual(call_args[0][0], "get")
-        self.assertEqual(
-            call_args[0][1],
-            "https://example.crm.dynamics.com/api/data/v9.2/RelationshipDefinitions",
-        )
+def test_extract_id_uses_precompiled_pattern(mixin):
+    """The GUID pattern is compiled once at import, not on every call."""
+    assert isinstance(_relationships._ENTITY_ID_RE, re.Pattern)
+    with patch.object(_relationships.re, "search", side_effect=AssertionError("re.search called")):
+        assert mixin._extract_id_from_header(_ONE_TO_MANY_ENTITY_ID) == _ONE_TO_MANY_ID
 
-    def test_list_relationships_no_params_by_default(self):
-        """Test that no $filter or $select are sent when not specified."""
-        mock_response = Mock()
-        mock_response.json.return_value = {"value": []}
-        self.client._mock_request.return_value = mock_response
 
-        self.client._list_relationships()
+# ---------------------------------------------------------------------------
+# _create_one_to_many_relationship
+# ---------------------------------------------------------------------------
 
-        call_args = self.client._mock_request.call_args
-        params = call_args[1].get("params", {})
-        self.assertNotIn("$filter", params)
-        self.assertNotIn("$select", params)
 
-    def test_list_relationships_filter_param(self):
-        """Test that $filter is forwarded."""
-        mock_response = Mock()
-        mock_response.json.return_value = {"value": []}
-        self.client._mock_request.return_value = mock_response
+def test_create_relationship_url(one_to_many_client, account_lookup, one_to_many_rel):
+    """Test that correct URL is used."""
+    one_to_many_client._create_one_to_many_relationship(account_lookup, one_to_many_rel)
 
-        self.client._list_relationships(filter="RelationshipType eq 'OneToManyRelationship'")
+    method, url, _ = one_to_many_client.calls[-1]
+    assert method == "post"
+    assert url == _RELATIONSHIP_DEFINITIONS_URL
 
-        call_args = self.client._mock_request.call_args
-        params = call_args[1].get("params", {})
-        self.assertEqual(params["$filter"], "RelationshipType eq 'OneToManyRelationship'")
 
-    def test_list_relationships_select_param(self):
-        """Test that $select is joined from list."""
-        mock_response = Mock()
-        mock_response.json.return_value = {"value": []}
-        self.client._mock_request.return_value = mock_response
+def test_create_relationship_payload_includes_lookup(one_to_many_client, account_lookup, one_to_many_rel):
+    """Test that payload includes both relationship and lookup metadata."""
+    one_to_many_client._create_one_to_many_relationship(account_lookup, one_to_many_rel)
 
-        self.client._list_relationships(select=["SchemaName", "ReferencedEntity"])
+    payload = one_to_many_client.calls[-1][2]["json"]
+    assert payload["@odata.type"] == "Microsoft.Dynamics.CRM.OneToManyRelationshipMetadata"
+    assert "Lookup" in payload
+    assert payload["Lookup"]["SchemaName"] == "new_AccountId"
 
-        call_args = self.client._mock_request.call_args
-        params = call_args[1].get("params", {})
-        self.assertEqual(params["$select"], "SchemaName,ReferencedEntity")
 
-    def test_list_relationships_returns_value_array(self):
-        """Test that the 'value' array is returned."""
-        expected = [
-            {"SchemaName": "new_account_orders", "MetadataId": "rel-1"},
-            {"SchemaName": "new_emp_proj", "MetadataId": "rel-2"},
-        ]
-        mock_response = Mock()
-        mock_response.json.return_value = {"value": expected}
-        self.client._mock_request.return_value = mock_response
+def test_create_relationship_with_solution(one_to_many_client, account_lookup, one_to_many_rel):
+    """Test that solution header is added when specified."""
+    one_to_many_client._create_one_to_many_relationship(account_lookup, one_to_many_rel, solution="MySolution")
 
-        result = self.client._list_relationships()
+    headers = one_to_many_client.calls[-1][2]["headers"]
+    assert headers["MSCRM.SolutionUniqueName"] == "MySolution"
 
-        self.assertEqual(result, expected)
 
-    def test_list_relationships_returns_empty_list_when_no_value(self):
-        """Test that [] is returned when response has no 'value' key."""
-        mock_response = Mock()
-        mock_response.json.return_value = {}
-        self.client._mock_request.return_value = mock_response
+def test_create_relationship_returns_result(one_to_many_client, account_lookup, one_to_many_rel):
+    """Test that result dictionary is correctly populated."""
+    result = one_to_many_client._create_one_to_many_relationship(account_lookup, one_to_many_rel)
 
-        result = self.client._list_relationships()
+    assert result["relationship_id"] == _ONE_TO_MANY_ID
+    assert result["relationship_schema_name"] == "new_account_orders"
+    assert result["lookup_schema_name"] == "new_AccountId"
+    assert result["referenced_entity"] == "account"
+    assert result["referencing_entity"] == "new_order"
 
-        self.assertEqual(result, [])
 
+# ---------------------------------------------------------------------------
+# _create_many_to_many_relationship
+# ---------------------------------------------------------------------------
 
-class TestListTableRelationships(unittest.TestCase):
-    """Tests for _list_table_relationships method."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.client = MockODataClientWithEntityLookup("https://example.crm.dynamics.com/api/data/v9.2")
-        self.client._mock_get_entity.return_value = {
-            "MetadataId": "ent-guid-1",
-            "LogicalName": "account",
-            "SchemaName": "Account",
-        }
+def test_create_m2m_relationship_url(m2m_client, m2m_rel):
+    """Test that correct URL is used."""
+    m2m_client._create_many_to_many_relationship(m2m_rel)
 
-    def _make_response(self, value):
-        r = Mock()
-        r.json.return_value = {"value": value}
-        return r
+    method, url, _ = m2m_client.calls[-1]
+    assert method == "post"
+    assert url == _RELATIONSHIP_DEFINITIONS_URL
 
-    def test_uses_one_to_many_and_many_to_many_urls(self):
-        """Test that OneToMany, ManyToOne, and ManyToMany URLs are queried."""
-        self.client._mock_request.side_effect = [
-            self._make_response([]),
-            self._make_response([]),
-            self._make_response([]),
-        ]
 
-        self.client._list_table_relationships("account")
-
-        calls = self.client._mock_request.call_args_list
-        self.assertEqual(len(calls), 3)
-        urls = [call[0][1] for call in calls]
-        self.assertTrue(any("OneToManyRelationships" in u for u in urls))
-        self.assertTrue(any("ManyToOneRelationships" in u for u in urls))
-        self.assertTrue(any("ManyToManyRelationships" in u for u in urls))
-
-    def test_uses_metadata_id_in_urls(self):
-        """Test that the entity MetadataId is used in all three URLs."""
-        self.client._mock_request.side_effect = [
-            self._make_response([]),
-            self._make_response([]),
-            self._make_response([]),
-        ]
+def test_create_m2m_relationship_returns_result(m2m_client, m2m_rel):
+    """Test that result dictionary is correctly populated."""
+    result = m2m_client._create_many_to_many_relationship(m2m_rel)
 
-        self.client._list_table_relationships("account")
-
-        calls = self.client._mock_request.call_args_list
-        for call in calls:
-            self.assertIn("ent-guid-1", call[0][1])
-
-    def test_combines_one_to_many_and_many_to_many_results(self):
-        """Test that results from all three sub-requests are combined."""
-        one_to_many = [{"SchemaName": "rel_1tm", "MetadataId": "r1"}]
-        many_to_one = [{"SchemaName": "rel_mt1", "MetadataId": "r2"}]
-        many_to_many = [{"SchemaName": "rel_mtm", "MetadataId": "r3"}]
-        self.client._mock_request.side_effect = [
-            self._make_response(one_to_many),
-            self._make_response(many_to_one),
-            self._make_response(many_to_many),
-        ]
+    assert result["relationship_id"] == _M2M_ID
+    assert result["relationship_schema_name"] == "new_account_contact"
+    assert result["entity1_logical_name"] == "account"
+    assert result["entity2_logical_name"] == "contact"
 
-        result = self.client._list_table_relationships("account")
 
-        self.assertEqual(len(result), 3)
-        self.assertEqual(result[0]["SchemaName"], "rel_1tm")
-        self.assertEqual(result[1]["SchemaName"], "rel_mt1")
-        self.assertEqual(result[2]["SchemaName"], "rel_mtm")
+def test_create_m2m_relationship_with_solution(m2m_client, m2m_rel):
+    """Solution name is added as MSCRM.SolutionUniqueName header."""
+    m2m_client._create_many_to_many_relationship(m2m_rel, solution="MySolution")
+
+    headers = m2m_client.calls[-1][2]["headers"]
+    assert headers["MSCRM.SolutionUniqueName"] == "MySolution"
+
+
+# ---------------------------------------------------------------------------
+# _delete_relationship
+# ---------------------------------------------------------------------------
+
+
+def test_delete_relationship_url(client):
+    """Test that correct URL is constructed."""
+    client._delete_relationship(_ONE_TO_MANY_ID)
+
+    method, url, _ = client.calls[-1]
+    assert method == "delete"
+    assert url == _ONE_TO_MANY_ENTITY_ID
+
+
+def test_delete_relationship_has_if_match_header(client):
+    """Test that If-Match header is set."""
+    client._delete_relationship(_ONE_TO_MANY_ID)
+
+    headers = client.calls[-1][2]["headers"]
+    assert headers["If-Match"] == "*"
 
-    def test_filter_param_is_forwarded(self):
-        """Test that $filter is sent to all three sub-requests."""
-        self.client._mock_request.side_effect = [
-            self._make_response([]),
-            self._make_response([]),
-            self._make_response([]),
-        ]
 
-        self.client._list_table_relationships("account", filter="IsManaged eq false")
-
-        calls = self.client._mock_request.call_args_list
-        for call in calls:
-            params = call[1].get("params", {})
-            self.assertEqual(params["$filter"], "IsManaged eq false")
-
-    def test_select_param_forwarded_to_one_to_many_only(self):
-        """$select is sent to OneToMany and ManyToOne but NOT ManyToMany.
-
-        ManyToManyRelationshipMetadata has a different property surface --
-        it does not expose ReferencedEntity or ReferencingEntity.  Sending a
-        $select with those names to the ManyToMany endpoint causes a 400 from
-        the server.
-        """
-        self.client._mock_request.side_effect = [
-            self._make_response([]),
-            self._make_response([]),
-            self._make_response([]),
+# ---------------------------------------------------------------------------
+# _get_relationship
+# ---------------------------------------------------------------------------
+
+
+def test_get_relationship_url_and_filter(client):
+    """Test that correct URL and filter are used."""
+    client.response = _make_response([])
+
+    client._get_relationship("new_account_orders")
+
+    method, url, kwargs = client.calls[-1]
+    assert method == "get"
+    assert url == _RELATIONSHIP_DEFINITIONS_URL
+    assert kwargs["params"]["$filter"] == "SchemaName eq 'new_account_orders'"
+
+
+def test_get_relationship_escapes_quotes(client):
+    """Test that single quotes in schema name are escaped."""
+    client.response = _make_response([])
+
+    # Schema names shouldn't have quotes, but test the escaping anyway
+    client._get_relationship("schema'name")
+
+    assert client.calls[-1][2]["params"]["$filter"] == "SchemaName eq 'schema''name'"
+
+
+def test_get_relationship_returns_first_result(client):
+    """Test that first result is returned when found."""
+    client.response = _make_response(
+        [
+            {"SchemaName": "new_account_orders", "MetadataId": "12345"},
+            {"SchemaName": "other", "MetadataId": "67890"},
         ]
+    )
+
+    result = client._get_relationship("new_account_orders")
+
+    assert result["SchemaName"] == "new_account_orders"
+    assert result["MetadataId"] == "12345"
+
+
+def test_get_relationship_returns_none_when_not_found(client):
+    """Test that None is returned when not found."""
+    client.response = _make_response([])
+
+    assert client._get_relationship("nonexistent") is None
+
+
+# ---------------------------------------------------------------------------
+# _list_relationships
+# ---------------------------------------------------------------------------
+
+
+def test_list_relationships_url(client):
+    """Test that correct URL is used."""
+    client.response = _make_response([])
+
+    client._list_relationships()
+
+    method, url, _ = client.calls[-1]
+    assert method == "get"
+    assert url == _RELATIONSHIP_DEFINITIONS_URL
+
+
+def test_list_relationships_no_params_by_default(client):
+    """Test that no $filter or $select are sent when not specified."""
+    client.response = _make_response([])
+
+    client._list_relationships()
+
+    params = client.calls[-1][2].get("params", {})
+    assert "$filter" not in params
+    assert "$select" not in params
+
+
+def test_list_relationships_filter_param(client):
+    """Test that $filter is forwarded."""
+    client.response = _make_response([])
+
+    client._list_relationships(filter="RelationshipType eq 'OneToManyRelationship'")
+
+    params = client.calls[-1][2].get("params", {})
+    assert params["$filter"] == "RelationshipType eq 'OneToManyRelationship'"
+
+
+def test_list_relationships_select_param(client):
+    """Test that $select is joined from list."""
+    client.response = _make_response([])
+
+    client._list_relationships(select=["SchemaName", "ReferencedEntity"])
+
+    params = client.calls[-1][2].get("params", {})
+    assert params["$select"] == "SchemaName,ReferencedEntity"
+
+
+def test_list_relationships_returns_value_array(client):
+    """Test that the 'value' array is returned."""
+    expected = [
+        {"SchemaName": "new_account_orders", "MetadataId": "rel-1"},
+        {"SchemaName": "new_emp_proj", "MetadataId": "rel-2"},
+    ]
+    client.response = _make_response(expected)
+
+    assert client._list_relationships() == expected
+
+
+def test_list_relationships_returns_empty_list_when_no_value(client):
+    """Test that [] is returned when response has no 'value' key."""
+    client.response = _FakeResponse({})
+
+    assert client._list_relationships() == []
+
+
+# ---------------------------------------------------------------------------
+# _list_table_relationships
+# ---------------------------------------------------------------------------
+
+
+def test_uses_one_to_many_and_many_to_many_urls(lookup_client):
+    """Test that OneToMany, ManyToOne, and ManyToMany URLs are queried."""
+    lookup_client.responses = [_make_response([]), _make_response([]), _make_response([])]
+
+    lookup_client._list_table_relationships("account")
+
+    calls = lookup_client.calls
+    assert len(calls) == 3
+    urls = [call[1] for call in calls]
+    assert any("OneToManyRelationships" in u for u in urls)
+    assert any("ManyToOneRelationships" in u for u in urls)
+    assert any("ManyToManyRelationships" in u for u in urls)
+
+
+def test_uses_metadata_id_in_urls(lookup_client):
+    """Test that the entity MetadataId is used in all three URLs."""
+    lookup_client.responses = [_make_response([]), _make_response([]), _make_response([])]
+
+    lookup_client._list_table_relationships("account")
+
+    for call in lookup_client.calls:
+        assert "ent-guid-1" in call[1]
+
+
+def test_combines_one_to_many_and_many_to_many_results(lookup_client):
+    """Test that results from all three sub-requests are combined."""
+    one_to_many = [{"SchemaName": "rel_1tm", "MetadataId": "r1"}]
+    many_to_one = [{"SchemaName": "rel_mt1", "MetadataId": "r2"}]
+    many_to_many = [{"SchemaName": "rel_mtm", "MetadataId": "r3"}]
+    lookup_client.responses = [
+        _make_response(one_to_many),
+        _make_response(many_to_one),
+        _make_response(many_to_many),
+    ]
+
+    result = lookup_client._list_table_relationships("account")
+
+    assert [r["SchemaName"] for r in result] == ["rel_1tm", "rel_mt1", "rel_mtm"]
+
+
+def test_filter_param_is_forwarded(lookup_client):
+    """Test that $filter is sent to all three sub-requests."""
+    lookup_client.responses = [_make_response([]), _make_response([]), _make_response([])]
+
+    lookup_client._list_table_relationships("account", filter="IsManaged eq false")
+
+    for call in lookup_client.calls:
+        assert call[2].get("params", {})["$filter"] == "IsManaged eq false"
+
 
-        self.client._list_table_relationships("account", select=["SchemaName", "ReferencedEntity"])
+def test_select_param_forwarded_to_one_to_many_only(lookup_client):
+    """$select is sent to OneToMany and ManyToOne but NOT ManyToMany.
 
-        calls = self.client._mock_request.call_args_list
-        self.assertEqual(len(calls), 3)
-        one_to_many_params = calls[0][1].get("params", {})
-        many_to_one_params = calls[1][1].get("params", {})
-        many_to_many_params = calls[2][1].get("params", {})
-        self.assertEqual(one_to_many_params["$select"], "SchemaName,ReferencedEntity")
-        self.assertEqual(many_to_one_params["$select"], "SchemaName,ReferencedEntity")
-        self.assertNotIn("$select", many_to_many_params)
+    ManyToManyRelationshipMetadata has a different property surface --
+    it does not expose ReferencedEntity or ReferencingEntity.  Sending a
+    $select with those names to the ManyToMany endpoint causes a 400 from
+    the server.
+    """
+    lookup_client.responses = [_make_response([]), _make_response([]), _make_response([])]
 
-    def test_raises_metadata_error_when_table_not_found(self):
-        """Test that MetadataError is raised when entity is not found."""
-        from PowerPlatform.Dataverse.core.errors import MetadataError
+    lookup_client._list_table_relationships("account", select=["SchemaName", "ReferencedEntity"])
 
-        self.client._mock_get_entity.return_value = None
+    calls = lookup_client.calls
+    assert len(calls) == 3
+    one_to_many_params = calls[0][2].get("params", {})
+    many_to_one_params = calls[1][2].get("params", {})
+    many_to_many_params = calls[2][2].get("params", {})
+    assert one_to_many_params["$select"] == "SchemaName,ReferencedEntity"
+    assert many_to_one_params["$select"] == "SchemaName,ReferencedEntity"
+    assert "$select" not in many_to_many_params
 
-        with self.assertRaises(MetadataError):
-            self.client._list_table_relationships("nonexistent_table")
 
+def test_raises_metadata_error_when_table_not_found(lookup_client):
+    """Test that MetadataError is raised when entity is not found."""
+    lookup_client.entity = None
 
-if __name__ == "__main__":
-    unittest.main()
+    with pytest.raises(MetadataError):
+        lookup_client._list_table_relationships("nonexistent_table")
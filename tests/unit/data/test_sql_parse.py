@@ -234,46 +234,44 @@ def _make_response(rows, next_link=None):
     return resp
 
 
-def _query_sql_client():
-    """Return a bare _ODataClient suitable for _query_sql patching."""
+def _query_sql_client(first_page, **request_kwargs):
+    """Return a bare _ODataClient wired for _query_sql.
+
+    ``_execute_raw`` returns *first_page*; follow-up page fetches go to a
+    ``_request`` mock built from *request_kwargs* (``return_value``/``side_effect``).
+    The client is throwaway, so stubs are plain attributes instead of patches.
+    """
     client = object.__new__(_ODataClient)
     client.api = "https://org.crm.dynamics.com/api/data/v9.2"
+    client._build_sql = MagicMock()
+    client._execute_raw = MagicMock(return_value=first_page)
+    client._request = MagicMock(**request_kwargs)
     return client
 
 
 def test_query_sql_single_page_returns_all_rows():
-    client = _query_sql_client()
     page = _make_response([{"id": 1}, {"id": 2}])
-    with (
-        patch.object(client, "_execute_raw", return_value=page),
-        patch.object(client, "_build_sql", return_value=MagicMock()),
-    ):
-        result = client._query_sql("SELECT id FROM account")
+    client = _query_sql_client(page)
+    result = client._query_sql("SELECT id FROM account")
     assert result == [{"id": 1}, {"id": 2}]
 
 
 def test_query_sql_follows_next_link():
-    client = _query_sql_client()
     page1 = _make_response([{"id": i} for i in range(5000)], next_link="https://org.example/page2")
     page2 = _make_response([{"id": i} for i in range(5000, 6000)])
 
     mock_request_resp = MagicMock()
     mock_request_resp.json.return_value = page2.json.return_value
 
-    with (
-        patch.object(client, "_execute_raw", return_value=page1),
-        patch.object(client, "_build_sql", return_value=MagicMock()),
-        patch.object(client, "_request", return_value=mock_request_resp) as mock_req,
-    ):
-        result = client._query_sql("SELECT id FROM account")
+    client = _query_sql_client(page1, return_value=mock_request_resp)
+    result = client._query_sql("SELECT id FROM account")
 
     assert len(result) == 6000
-    mock_req.assert_called_once_with("get", "https://org.example/page2")
+    client._request.assert_called_once_with("get", "https://org.example/page2")
 
 
 def test_query_sql_follows_odata_next_link_variant():
     """Older OData format uses 'odata.nextLink' without the @ prefix."""
-    client = _query_sql_client()
     page1_body = {"value": [{"id": 1}], "odata.nextLink": "https://org.example/page2"}
     page2_body = {"value": [{"id": 2}]}
 
@@ -282,19 +280,14 @@ def test_query_sql_follows_odata_next_link_variant():
     resp2 = MagicMock()
     resp2.json.return_value = page2_body
 
-    with (
-        patch.object(client, "_execute_raw", return_value=resp1),
-        patch.object(client, "_build_sql", return_value=MagicMock()),
-        patch.object(client, "_request", return_value=resp2),
-    ):
-        result = client._query_sql("SELECT id FROM account")
+    client = _query_sql_client(resp1, return_value=resp2)
+    result = client._query_sql("SELECT id FROM account")
 
     assert result == [{"id": 1}, {"id": 2}]
 
 
 def test_query_sql_multipage_collects_all():
     """Three pages: verifies the loop continues past the second page."""
-    client = _query_sql_client()
     page1 = _make_response([{"id": 1}], next_link="https://org.example/p2")
     page2_body = {"value": [{"id": 2}], "@odata.nextLink": "https://org.example/p3"}
     page3_body = {"value": [{"id": 3}]}
@@ -304,31 +297,22 @@ def test_query_sql_multipage_collects_all():
     resp3 = MagicMock()
     resp3.json.return_value = page3_body
 
-    with (
-        patch.object(client, "_execute_raw", return_value=page1),
-        patch.object(client, "_build_sql", return_value=MagicMock()),
-        patch.object(client, "_request", side_effect=[resp2, resp3]),
-    ):
-        result = client._query_sql("SELECT id FROM account")
+    client = _query_sql_client(page1, side_effect=[resp2, resp3])
+    result = client._query_sql("SELECT id FROM account")
 
     assert result == [{"id": 1}, {"id": 2}, {"id": 3}]
 
 
 def test_query_sql_mid_pagination_error_warns_and_returns_partial():
     """A failing page mid-pagination emits a RuntimeWarning and returns rows collected so far."""
-    client = _query_sql_client()
     page1 = _make_response([{"id": 1}], next_link="https://org.example/p2")
 
     bad_resp = MagicMock()
     bad_resp.json.side_effect = ValueError("not JSON")
 
-    with (
-        patch.object(client, "_execute_raw", return_value=page1),
-        patch.object(client, "_build_sql", return_value=MagicMock()),
-        patch.object(client, "_request", return_value=bad_resp),
-    ):
-        with pytest.warns(RuntimeWarning, match="pagination stopped"):
-            result = client._query_sql("SELECT id FROM account")
+    client = _query_sql_client(page1, return_value=bad_resp)
+    with pytest.warns(RuntimeWarning, match="pagination stopped"):
+        result = client._query_sql("SELECT id FROM account")
 
     assert result == [{"id": 1}]
 
@@ -336,7 +320,6 @@ def test_query_sql_mid_pagination_error_warns_and_returns_partial():
 def test_query_sql_repeated_next_link_warns_and_stops():
     """If the server keeps returning the same @odata.nextLink a RuntimeWarning is emitted and
     the loop stops without running forever."""
-    client = _query_sql_client()
     # Both pages return the same next_link — simulates a server that re-executes the SQL
     repeating_body = {"value": [{"id": 1}], "@odata.nextLink": "https://org.example/page2"}
 
@@ -345,56 +328,42 @@ def test_query_sql_repeated_next_link_warns_and_stops():
     resp2 = MagicMock()
     resp2.json.return_value = repeating_body  # same link again
 
-    with (
-        patch.object(client, "_execute_raw", return_value=resp1),
-        patch.object(client, "_build_sql", return_value=MagicMock()),
-        patch.object(client, "_request", return_value=resp2) as mock_req,
-    ):
-        with pytest.warns(RuntimeWarning, match="pagination stopped"):
-            result = client._query_sql("SELECT id FROM account")
+    client = _query_sql_client(resp1, return_value=resp2)
+    with pytest.warns(RuntimeWarning, match="pagination stopped"):
+        result = client._query_sql("SELECT id FROM account")
 
     # fetched page2 once, then detected the cycle and stopped
-    mock_req.assert_called_once_with("get", "https://org.example/page2")
+    client._request.assert_called_once_with("get", "https://org.example/page2")
     assert result == [{"id": 1}, {"id": 1}]
 
 
 def test_query_sql_empty_page_stops_pagination():
     """If a page returns an empty value array (but includes @odata.nextLink), stop — no infinite loop."""
-    client = _query_sql_client()
     page1 = _make_response([{"id": 1}], next_link="https://org.example/p2")
     empty_page_body = {"value": [], "@odata.nextLink": "https://org.example/p3"}
 
     resp2 = MagicMock()
     resp2.json.return_value = empty_page_body
 
-    with (
-        patch.object(client, "_execute_raw", return_value=page1),
-        patch.object(client, "_build_sql", return_value=MagicMock()),
-        patch.object(client, "_request", return_value=resp2) as mock_req,
-    ):
-        result = client._query_sql("SELECT id FROM account")
+    client = _query_sql_client(page1, return_value=resp2)
+    result = client._query_sql("SELECT id FROM account")
 
     assert result == [{"id": 1}]
-    mock_req.assert_called_once()  # fetched p2, did not follow p3
+    client._request.assert_called_once()  # fetched p2, did not follow p3
 
 
 def test_query_sql_non_string_next_link_stops_pagination():
     """A non-string @odata.nextLink value (e.g. a boolean) does not trigger a request."""
-    client = _query_sql_client()
     page1_body = {"value": [{"id": 1}], "@odata.nextLink": True}
 
     resp1 = MagicMock()
     resp1.json.return_value = page1_body
 
-    with (
-        patch.object(client, "_execute_raw", return_value=resp1),
-        patch.object(client, "_build_sql", return_value=MagicMock()),
-        patch.object(client, "_request") as mock_req,
-    ):
-        result = client._query_sql("SELECT id FROM account")
+    client = _query_sql_client(resp1)
+    result = client._query_sql("SELECT id FROM account")
 
     assert result == [{"id": 1}]
-    mock_req.assert_not_called()
+    client._request.assert_not_called()
 
 
 def test_query_sql_stuck_pagingcookie_warns_and_stops():
@@ -403,8 +372,6 @@ def test_query_sql_stuck_pagingcookie_warns_and_stops():
     import warnings
     from urllib.parse import quote as _url_quote
 
-    client = _query_sql_client()
-
     # Build a next_link that carries a recognisable pagingcookie.
     # The pagingcookie attribute value is itself URL-encoded inside the skiptoken
     # (matching the double-encoding the real Dataverse server produces).
@@ -423,17 +390,13 @@ def test_query_sql_stuck_pagingcookie_warns_and_stops():
     resp2 = MagicMock()
     resp2.json.return_value = page2_body
 
-    with (
-        patch.object(client, "_execute_raw", return_value=resp1),
-        patch.object(client, "_build_sql", return_value=MagicMock()),
-        patch.object(client, "_request", return_value=resp2) as mock_req,
-    ):
-        with warnings.catch_warnings(record=True) as caught:
-            warnings.simplefilter("always")
-            result = client._query_sql("SELECT id FROM account")
+    client = _query_sql_client(resp1, return_value=resp2)
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        result = client._query_sql("SELECT id FROM account")
 
     # Page 2 was fetched; page 3 was not (cookie repeat detected after page 2)
-    mock_req.assert_called_once_with("get", next_link_p2)
+    client._request.assert_called_once_with("get", next_link_p2)
     assert result == [{"id": 1}, {"id": 2}]
 
     assert len(caught) == 1
@@ -520,16 +483,11 @@ def test_extract_pagingcookie_exception_returns_none():
 def test_query_sql_request_exception_warns_and_returns_partial():
     """When _request raises an exception mid-pagination a RuntimeWarning is emitted and
     the rows collected so far are returned."""
-    client = _query_sql_client()
     page1 = _make_response([{"id": 1}], next_link="https://org.example/p2")
 
-    with (
-        patch.object(client, "_execute_raw", return_value=page1),
-        patch.object(client, "_build_sql", return_value=MagicMock()),
-        patch.object(client, "_request", side_effect=ConnectionError("network timeout")),
-    ):
-        with pytest.warns(RuntimeWarning, match="pagination stopped"):
-            result = client._query_sql("SELECT id FROM account")
+    client = _query_sql_client(page1, side_effect=ConnectionError("network timeout"))
+    with pytest.warns(RuntimeWarning, match="pagination stopped"):
+        result = client._query_sql("SELECT id FROM account")
 
     assert result == [{"id": 1}]
 
@@ -537,18 +495,13 @@ def test_query_sql_request_exception_warns_and_returns_partial():
 def test_query_sql_non_dict_page_body_stops_pagination():
     """When a pagination response contains valid JSON that is not a dict (e.g. a list),
     pagination stops silently and the rows collected so far are returned."""
-    client = _query_sql_client()
     page1 = _make_response([{"id": 1}], next_link="https://org.example/p2")
 
     bad_resp = MagicMock()
     bad_resp.json.return_value = [{"id": 2}]  # a list, not a dict
 
-    with (
-        patch.object(client, "_execute_raw", return_value=page1),
-        patch.object(client, "_build_sql", return_value=MagicMock()),
-        patch.object(client, "_request", return_value=bad_resp) as mock_req,
-    ):
-        result = client._query_sql("SELECT id FROM account")
+    client = _query_sql_client(page1, return_value=bad_resp)
+    result = client._query_sql("SELECT id FROM account")
 
-    mock_req.assert_called_once_with("get", "https://org.example/p2")
+    client._request.assert_called_once_with("get", "https://org.example/p2")
     assert result == [{"id": 1}]
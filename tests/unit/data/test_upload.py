@@ -31,10 +31,9 @@ class TestUploadFile(unittest.TestCase):
     def setUp(self):
         self.od = _make_odata_client()
         self.od._entity_set_from_schema_name = MagicMock(return_value="accounts")
-        self.od._get_entity_by_table_schema_name = MagicMock(
-            return_value={"MetadataId": "meta-1", "LogicalName": "account"}
+        self.od._get_entity_with_attribute = MagicMock(
+            return_value=({"MetadataId": "meta-1", "LogicalName": "account"}, {"LogicalName": "new_document"})
         )
-        self.od._get_attribute_metadata = MagicMock(return_value={"LogicalName": "new_document"})
 
     def test_auto_mode_small_file(self):
         """Auto mode routes files <128MB to _upload_file_small."""
@@ -92,7 +91,7 @@ class TestUploadFile(unittest.TestCase):
 
     def test_column_auto_creation_when_missing(self):
         """Creates file column when attribute metadata not found."""
-        self.od._get_attribute_metadata = MagicMock(return_value=None)
+        self.od._get_entity_with_attribute.return_value = ({"MetadataId": "meta-1", "LogicalName": "account"}, None)
         self.od._create_columns = MagicMock()
         self.od._wait_for_attribute_visibility = MagicMock()
         self.od._upload_file_small = MagicMock()
@@ -110,26 +109,27 @@ class TestUploadFile(unittest.TestCase):
         self.addCleanup(os.unlink, path)
         self.od._upload_file("account", "guid-1", "new_Document", path, mode="small")
         self.od._create_columns.assert_not_called()
+        self.od._get_entity_with_attribute.assert_called_once_with("account", "new_Document")
 
-    def test_no_entity_metadata_skips_column_check(self):
-        """Skips column check entirely when entity metadata is None."""
-        self.od._get_entity_by_table_schema_name = MagicMock(return_value=None)
-        self.od._get_attribute_metadata = MagicMock()
+    def test_no_entity_metadata_skips_column_creation(self):
+        """Does not create the column when entity metadata is None."""
+        self.od._get_entity_with_attribute.return_value = (None, None)
+        self.od._create_columns = MagicMock()
         self.od._upload_file_small = MagicMock()
         path = _make_temp_file()
         self.addCleanup(os.unlink, path)
         self.od._upload_file("account", "guid-1", "new_Document", path, mode="small")
-        self.od._get_attribute_metadata.assert_not_called()
+        self.od._create_columns.assert_not_called()
 
-    def test_entity_metadata_without_metadata_id_skips_column_check(self):
-        """Skips attribute check when entity metadata has no MetadataId."""
-        self.od._get_entity_by_table_schema_name = MagicMock(return_value={"LogicalName": "account"})
-        self.od._get_attribute_metadata = MagicMock()
+    def test_entity_metadata_without_metadata_id_skips_column_creation(self):
+        """Does not create the column when entity metadata has no MetadataId."""
+        self.od._get_entity_with_attribute.return_value = ({"LogicalName": "account"}, None)
+        self.od._create_columns = MagicMock()
         self.od._upload_file_small = MagicMock()
         path = _make_temp_file()
         self.addCleanup(os.unlink, path)
         self.od._upload_file("account", "guid-1", "new_Document", path, mode="small")
-        self.od._get_attribute_metadata.assert_not_called()
+        self.od._create_columns.assert_not_called()
 
     def test_lowercases_attribute_name(self):
         """File name attribute is lowercased for URL usage."""
@@ -79,6 +79,12 @@ class TestFormatValue(unittest.TestCase):
 
         self.assertEqual(_format_value(Color.RED), "'red'")
 
+    def test_str_subclass_uses_fallback(self):
+        class Name(str):
+            pass
+
+        self.assertEqual(_format_value(Name("O'Brien")), "'O''Brien'")
+
     def test_string(self):
         self.assertEqual(_format_value("hello"), "'hello'")
 
@@ -501,13 +507,17 @@ class TestLogicalOperators(unittest.TestCase):
 class TestStrAndRepr(unittest.TestCase):
     """Tests for __str__ and __repr__."""
 
-    def test_str_delegates_to_odata(self):
-        self.assertEqual(str(eq("a", 1)), "a eq 1")
-
-    def test_repr_includes_class_name(self):
-        r = repr(eq("a", 1))
-        self.assertIn("_ComparisonFilter", r)
-        self.assertIn("a eq 1", r)
+    def test_str_and_repr(self):
+        cases = [
+            (eq("a", 1), "a eq 1", "_ComparisonFilter('a eq 1')"),
+            (eq("a", 1) & ne("b", "x"), "(a eq 1 and b ne 'x')", "_AndFilter(\"(a eq 1 and b ne 'x')\")"),
+            (~eq("a", 1), "not (a eq 1)", "_NotFilter('not (a eq 1)')"),
+            (raw("statecode eq 0"), "statecode eq 0", "_RawFilter('statecode eq 0')"),
+        ]
+        for expr, expected_str, expected_repr in cases:
+            with self.subTest(expr=expected_str):
+                self.assertEqual(str(expr), expected_str)
+                self.assertEqual(repr(expr), expected_repr)
 
 
 class TestFilterExpressionBase(unittest.TestCase):
@@ -3,6 +3,8 @@
 
 """Tests for label models."""
 
+import pytest
+
 from PowerPlatform.Dataverse.models.labels import (
     LocalizedLabel,
     Label,
@@ -12,38 +14,35 @@ from PowerPlatform.Dataverse.models.labels import (
 class TestLocalizedLabel:
     """Tests for LocalizedLabel."""
 
-    def test_to_dict_basic(self):
-        """Test basic serialization."""
-        label = LocalizedLabel(label="Test", language_code=1033)
-        result = label.to_dict()
-
-        assert result["@odata.type"] == "Microsoft.Dynamics.CRM.LocalizedLabel"
-        assert result["Label"] == "Test"
-        assert result["LanguageCode"] == 1033
-
-    def test_to_dict_with_additional_properties(self):
-        """Test that additional_properties are merged."""
-        label = LocalizedLabel(
-            label="Test",
-            language_code=1033,
-            additional_properties={"IsManaged": True, "MetadataId": "abc-123"},
-        )
-        result = label.to_dict()
-
-        assert result["Label"] == "Test"
-        assert result["IsManaged"] is True
-        assert result["MetadataId"] == "abc-123"
-
-    def test_additional_properties_can_override(self):
-        """Test that additional_properties can override default values."""
-        label = LocalizedLabel(
-            label="Original",
-            language_code=1033,
-            additional_properties={"Label": "Overridden"},
-        )
-        result = label.to_dict()
-
-        assert result["Label"] == "Overridden"
+    @pytest.mark.parametrize(
+        "kwargs,expected",
+        [
+            pytest.param(
+                {"label": "Test", "language_code": 1033},
+                {"@odata.type": "Microsoft.Dynamics.CRM.LocalizedLabel", "Label": "Test", "LanguageCode": 1033},
+                id="basic",
+            ),
+            pytest.param(
+                {
+                    "label": "Test",
+                    "language_code": 1033,
+                    "additional_properties": {"IsManaged": True, "MetadataId": "abc-123"},
+                },
+                {"Label": "Test", "IsManaged": True, "MetadataId": "abc-123"},
+                id="additional_properties_merged",
+            ),
+            pytest.param(
+                {"label": "Original", "language_code": 1033, "additional_properties": {"Label": "Overridden"}},
+                {"Label": "Overridden"},
+                id="additional_properties_override",
+            ),
+        ],
+    )
+    def test_to_dict(self, kwargs, expected):
+        """to_dict emits the Web API shape, with additional_properties merged last."""
+        result = LocalizedLabel(**kwargs).to_dict()
+
+        assert {k: result[k] for k in expected} == expected
 
 
 class TestLabel:
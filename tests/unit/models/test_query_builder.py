@@ -4,7 +4,7 @@
 """Unit tests for QueryBuilder class."""
 
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from PowerPlatform.Dataverse.models.query_builder import QueryBuilder
 
@@ -30,6 +30,24 @@ class TestQueryBuilderConstruction(unittest.TestCase):
         with self.assertRaises(TypeError):
             QueryBuilder("account", _select=["name"])  # type: ignore
 
+    def test_builders_have_no_instance_dict(self):
+        from PowerPlatform.Dataverse.models.query_builder import ExpandOption
+
+        for obj in (QueryBuilder("account"), ExpandOption("Account_Tasks")):
+            self.assertFalse(hasattr(obj, "__dict__"))
+            with self.assertRaises(AttributeError):
+                obj.unknown = 1  # type: ignore[attr-defined]
+
+    def test_fresh_builders_do_not_share_state(self):
+        first = QueryBuilder("account")
+        second = QueryBuilder("account")
+        first.select("name").order_by("name").expand("primarycontactid")
+        self.assertEqual(second.build(), {"table": "account"})
+        self.assertEqual(
+            first.build(),
+            {"table": "account", "select": ["name"], "orderby": ["name"], "expand": ["primarycontactid"]},
+        )
+
 
 class TestSelect(unittest.TestCase):
     """Tests for the select() method."""
@@ -484,6 +502,27 @@ class TestBuild(unittest.TestCase):
         qb.where(col("revenue") > 100000)
         self.assertEqual(qb.build()["filter"], "statecode eq 0 and revenue gt 100000")
 
+    def test_build_reuses_compiled_filter(self):
+        """Repeated build() calls compile each filter expression only once."""
+        from PowerPlatform.Dataverse.models.filters import col
+
+        expr = col("statecode") == 0
+        qb = QueryBuilder("account").where(expr)
+        with patch.object(type(expr), "to_odata", autospec=True, return_value="statecode eq 0") as to_odata:
+            self.assertEqual(qb.build()["filter"], "statecode eq 0")
+            self.assertEqual(qb.build()["filter"], "statecode eq 0")
+        self.assertEqual(to_odata.call_count, 1)
+
+    def test_build_after_more_where_calls_extends_filter(self):
+        """Filters added after a build() are AND-joined onto the earlier ones."""
+        from PowerPlatform.Dataverse.models.filters import col
+
+        qb = QueryBuilder("account").where(col("statecode") == 0)
+        self.assertEqual(qb.build()["filter"], "statecode eq 0")
+        qb.where(col("revenue") > 100000)
+        qb._filter_parts.append("name ne null")
+        self.assertEqual(qb.build()["filter"], "statecode eq 0 and revenue gt 100000 and name ne null")
+
 
 class TestMethodChainingReturnsSelf(unittest.TestCase):
     """Verify all public methods return self for chaining."""
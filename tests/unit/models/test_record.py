@@ -9,13 +9,19 @@ from PowerPlatform.Dataverse.models.record import Record
 class TestRecordDictLike(unittest.TestCase):
     """Dict-like access on Record delegates to self.data."""
 
-    def setUp(self):
-        self.record = Record(
+    @staticmethod
+    def _make_record():
+        return Record(
             id="guid-1",
             table="account",
             data={"name": "Contoso", "telephone1": "555-0100"},
         )
 
+    @classmethod
+    def setUpClass(cls):
+        # Shared by the read-only tests; mutating tests build their own record.
+        cls.record = cls._make_record()
+
     def test_getitem(self):
         self.assertEqual(self.record["name"], "Contoso")
 
@@ -38,12 +44,14 @@ class TestRecordDictLike(unittest.TestCase):
         self.assertEqual(len(self.record), 2)
 
     def test_setitem(self):
-        self.record["new_key"] = "value"
-        self.assertEqual(self.record["new_key"], "value")
+        record = self._make_record()
+        record["new_key"] = "value"
+        self.assertEqual(record["new_key"], "value")
 
     def test_delitem(self):
-        del self.record["telephone1"]
-        self.assertNotIn("telephone1", self.record)
+        record = self._make_record()
+        del record["telephone1"]
+        self.assertNotIn("telephone1", record)
 
     def test_keys_values_items(self):
         self.assertEqual(set(self.record.keys()), {"name", "telephone1"})
@@ -67,26 +75,17 @@ class TestRecordFromApiResponse(unittest.TestCase):
         self.assertEqual(record["accountid"], "guid-1")
         self.assertEqual(record["name"], "Contoso")
 
-    def test_extracts_etag(self):
-        raw = {"@odata.etag": 'W/"12345"', "name": "Test"}
-        record = Record.from_api_response("account", raw)
-        self.assertEqual(record.etag, 'W/"12345"')
-
-    def test_no_etag(self):
-        raw = {"name": "Test"}
-        record = Record.from_api_response("account", raw)
-        self.assertIsNone(record.etag)
-
-    def test_record_id_set(self):
-        raw = {"name": "Test"}
-        record = Record.from_api_response("account", raw, record_id="guid-1")
-        self.assertEqual(record.id, "guid-1")
-        self.assertEqual(record.table, "account")
-
-    def test_record_id_default_empty(self):
-        raw = {"name": "Test"}
-        record = Record.from_api_response("account", raw)
-        self.assertEqual(record.id, "")
+    def test_metadata_attributes(self):
+        cases = [
+            ({"@odata.etag": 'W/"12345"', "name": "Test"}, {}, {"etag": 'W/"12345"', "id": "", "table": "account"}),
+            ({"name": "Test"}, {}, {"etag": None, "id": "", "table": "account"}),
+            ({"name": "Test"}, {"record_id": "guid-1"}, {"etag": None, "id": "guid-1", "table": "account"}),
+        ]
+        for raw, kwargs, expected in cases:
+            with self.subTest(raw=raw, **kwargs):
+                record = Record.from_api_response("account", raw, **kwargs)
+                for attr, value in expected.items():
+                    self.assertEqual(getattr(record, attr), value)
 
     def test_to_dict(self):
         raw = {"@odata.etag": 'W/"1"', "name": "Test", "revenue": 1000}
@@ -3,6 +3,8 @@
 
 import unittest
 
+import pytest
+
 from PowerPlatform.Dataverse.models.relationship import (
     RelationshipInfo,
     CascadeConfiguration,
@@ -12,6 +14,31 @@ from PowerPlatform.Dataverse.models.relationship import (
 )
 from PowerPlatform.Dataverse.models.labels import Label, LocalizedLabel
 
+# Full to_dict() payloads for the minimal relationship definitions below
+_EXPECTED_ONE_TO_MANY_BASIC = {
+    "@odata.type": "Microsoft.Dynamics.CRM.OneToManyRelationshipMetadata",
+    "SchemaName": "new_account_orders",
+    "ReferencedEntity": "account",
+    "ReferencingEntity": "new_order",
+    "ReferencedAttribute": "accountid",
+    "CascadeConfiguration": {
+        "Assign": "NoCascade",
+        "Delete": "RemoveLink",
+        "Merge": "NoCascade",
+        "Reparent": "NoCascade",
+        "Share": "NoCascade",
+        "Unshare": "NoCascade",
+    },
+}
+
+_EXPECTED_MANY_TO_MANY_BASIC = {
+    "@odata.type": "Microsoft.Dynamics.CRM.ManyToManyRelationshipMetadata",
+    "SchemaName": "new_account_contact",
+    "Entity1LogicalName": "account",
+    "Entity2LogicalName": "contact",
+    "IntersectEntityName": "new_account_contact",
+}
+
 
 class TestRelationshipInfoFromOneToMany(unittest.TestCase):
     """Tests for RelationshipInfo.from_one_to_many factory."""
@@ -151,53 +178,46 @@ class TestRelationshipInfoFromApiResponse(unittest.TestCase):
 class TestCascadeConfiguration:
     """Tests for CascadeConfiguration."""
 
-    def test_to_dict_defaults(self):
-        """Test default values."""
-        cascade = CascadeConfiguration()
-        result = cascade.to_dict()
-
-        assert result["Assign"] == "NoCascade"
-        assert result["Delete"] == "RemoveLink"
-        assert result["Merge"] == "NoCascade"
-        assert result["Reparent"] == "NoCascade"
-        assert result["Share"] == "NoCascade"
-        assert result["Unshare"] == "NoCascade"
-
-    def test_to_dict_custom_values(self):
-        """Test custom cascade values."""
-        cascade = CascadeConfiguration(
-            assign="Cascade",
-            delete="Restrict",
-        )
-        result = cascade.to_dict()
-
-        assert result["Assign"] == "Cascade"
-        assert result["Delete"] == "Restrict"
-
-    def test_to_dict_with_additional_properties(self):
-        """Test additional properties like Archive and RollupView."""
-        cascade = CascadeConfiguration(
-            additional_properties={
-                "Archive": "NoCascade",
-                "RollupView": "NoCascade",
-            }
-        )
-        result = cascade.to_dict()
+    @pytest.mark.parametrize(
+        "kwargs,expected",
+        [
+            pytest.param(
+                {},
+                {
+                    "Assign": "NoCascade",
+                    "Delete": "RemoveLink",
+                    "Merge": "NoCascade",
+                    "Reparent": "NoCascade",
+                    "Share": "NoCascade",
+                    "Unshare": "NoCascade",
+                },
+                id="defaults",
+            ),
+            pytest.param(
+                {"assign": "Cascade", "delete": "Restrict"},
+                {"Assign": "Cascade", "Delete": "Restrict"},
+                id="custom_values",
+            ),
+            pytest.param(
+                {"additional_properties": {"Archive": "NoCascade", "RollupView": "NoCascade"}},
+                {"Archive": "NoCascade", "RollupView": "NoCascade"},
+                id="additional_properties",
+            ),
+        ],
+    )
+    def test_to_dict(self, kwargs, expected):
+        """to_dict emits each cascade behavior, plus any additional_properties."""
+        result = CascadeConfiguration(**kwargs).to_dict()
 
-        assert result["Archive"] == "NoCascade"
-        assert result["RollupView"] == "NoCascade"
+        assert {k: result[k] for k in expected} == expected
 
 
 class TestLookupAttributeMetadata:
     """Tests for LookupAttributeMetadata."""
 
-    def test_to_dict_basic(self):
+    def test_to_dict_basic(self, account_lookup):
         """Test basic serialization."""
-        lookup = LookupAttributeMetadata(
-            schema_name="new_AccountId",
-            display_name=Label(localized_labels=[LocalizedLabel(label="Account", language_code=1033)]),
-        )
-        result = lookup.to_dict()
+        result = account_lookup.to_dict()
 
         assert result["@odata.type"] == "Microsoft.Dynamics.CRM.LookupAttributeMetadata"
         assert result["SchemaName"] == "new_AccountId"
@@ -205,22 +225,22 @@ class TestLookupAttributeMetadata:
         assert result["AttributeTypeName"]["Value"] == "LookupType"
         assert result["RequiredLevel"]["Value"] == "None"
 
-    def test_to_dict_required(self):
+    def test_to_dict_required(self, account_label):
         """Test required level."""
         lookup = LookupAttributeMetadata(
             schema_name="new_AccountId",
-            display_name=Label(localized_labels=[LocalizedLabel(label="Account", language_code=1033)]),
+            display_name=account_label,
             required_level="ApplicationRequired",
         )
         result = lookup.to_dict()
 
         assert result["RequiredLevel"]["Value"] == "ApplicationRequired"
 
-    def test_to_dict_with_description(self):
+    def test_to_dict_with_description(self, account_label):
         """Test with description."""
         lookup = LookupAttributeMetadata(
             schema_name="new_AccountId",
-            display_name=Label(localized_labels=[LocalizedLabel(label="Account", language_code=1033)]),
+            display_name=account_label,
             description=Label(localized_labels=[LocalizedLabel(label="The related account", language_code=1033)]),
         )
         result = lookup.to_dict()
@@ -257,14 +277,7 @@ class TestOneToManyRelationshipMetadata:
             referencing_entity="new_order",
             referenced_attribute="accountid",
         )
-        result = rel.to_dict()
-
-        assert result["@odata.type"] == "Microsoft.Dynamics.CRM.OneToManyRelationshipMetadata"
-        assert result["SchemaName"] == "new_account_orders"
-        assert result["ReferencedEntity"] == "account"
-        assert result["ReferencingEntity"] == "new_order"
-        assert result["ReferencedAttribute"] == "accountid"
-        assert "CascadeConfiguration" in result
+        assert rel.to_dict() == _EXPECTED_ONE_TO_MANY_BASIC
 
     def test_to_dict_with_custom_cascade(self):
         """Test with custom cascade configuration."""
@@ -326,14 +339,8 @@ class TestManyToManyRelationshipMetadata:
             entity1_logical_name="account",
             entity2_logical_name="contact",
         )
-        result = rel.to_dict()
-
-        assert result["@odata.type"] == "Microsoft.Dynamics.CRM.ManyToManyRelationshipMetadata"
-        assert result["SchemaName"] == "new_account_contact"
-        assert result["Entity1LogicalName"] == "account"
-        assert result["Entity2LogicalName"] == "contact"
-        # IntersectEntityName should default to schema_name
-        assert result["IntersectEntityName"] == "new_account_contact"
+        # IntersectEntityName defaults to schema_name
+        assert rel.to_dict() == _EXPECTED_MANY_TO_MANY_BASIC
 
     def test_to_dict_with_explicit_intersect_name(self):
         """Test with explicit intersect entity name."""
@@ -9,8 +9,10 @@ from PowerPlatform.Dataverse.models.table_info import ColumnInfo, TableInfo
 class TestTableInfoLegacyAccess(unittest.TestCase):
     """TableInfo should support both legacy dict keys and attribute access."""
 
-    def setUp(self):
-        self.info = TableInfo(
+    @classmethod
+    def setUpClass(cls):
+        # Every test only reads from the instance, so one is shared by the class
+        cls.info = TableInfo(
             schema_name="new_Product",
             logical_name="new_product",
             entity_set_name="new_products",
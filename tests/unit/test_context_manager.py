@@ -84,6 +84,15 @@ class TestSessionLifecycle(unittest.TestCase):
             odata = client._get_odata()
             self.assertIs(odata._http._session, client._session)
 
+    def test_session_attached_to_odata_created_before_enter(self):
+        """An _ODataClient built before entering picks up the session on enter."""
+        client = DataverseClient(self.base_url, self.mock_credential)
+        odata = client._get_odata()
+        self.assertIsNone(odata._http._session)
+        with client:
+            self.assertIs(client._get_odata(), odata)
+            self.assertIs(odata._http._session, client._session)
+
     def test_no_session_without_context_manager(self):
         """Client without 'with' should have no session."""
         client = DataverseClient(self.base_url, self.mock_credential)
@@ -158,6 +167,7 @@ class TestCloseMethod(unittest.TestCase):
         odata = client._get_odata()
         odata._logical_to_entityset_cache["test"] = "value"
         odata._logical_primaryid_cache["test"] = "value"
+        odata._entityset_miss_cache["missing"] = 0.0
         odata._picklist_label_cache["test"] = {"ts": 0, "picklists": {"attr": {}}}
 
         client.close()
@@ -165,6 +175,7 @@ class TestCloseMethod(unittest.TestCase):
         # _odata is now None, but we held a reference
         self.assertEqual(len(odata._logical_to_entityset_cache), 0)
         self.assertEqual(len(odata._logical_primaryid_cache), 0)
+        self.assertEqual(len(odata._entityset_miss_cache), 0)
         self.assertEqual(len(odata._picklist_label_cache), 0)
 
 
@@ -4,6 +4,7 @@
 """Tests for operation_context support on DataverseClient and User-Agent header."""
 
 import unittest
+from dataclasses import FrozenInstanceError
 from unittest.mock import MagicMock
 
 from azure.core.credentials import TokenCredential
@@ -53,6 +54,11 @@ class TestOperationContextValidation(unittest.TestCase):
         with self.assertRaises(ValueError):
             OperationContext(user_agent_context="justaplainstring")
 
+    def test_is_frozen(self):
+        ctx = OperationContext(user_agent_context="app=test/1.0")
+        with self.assertRaises(FrozenInstanceError):
+            ctx.user_agent_context = "app=other/2.0"  # type: ignore[misc]
+
 
 class TestOperationContextConfig(unittest.TestCase):
     """Tests for operation_context on DataverseConfig."""
@@ -70,6 +76,11 @@ class TestOperationContextConfig(unittest.TestCase):
         config = DataverseConfig()
         self.assertIsNone(config.operation_context)
 
+    def test_config_is_frozen(self):
+        cfg = DataverseConfig(operation_context=OperationContext(user_agent_context="app=test/1.0"))
+        with self.assertRaises(FrozenInstanceError):
+            cfg.operation_context = None  # type: ignore[misc]
+
 
 class TestOperationContextClient(unittest.TestCase):
     """Tests for context kwarg on DataverseClient."""
@@ -15,6 +15,7 @@ Verifies all Phase 1 breaking changes and deprecations in one place:
 7. No DeprecationWarning is emitted at module import time.
 """
 
+import operator
 import unittest
 import warnings
 from unittest.mock import MagicMock
@@ -598,35 +599,26 @@ class TestRemovedBuilderFilterMethods(unittest.TestCase):
 class TestColumnProxyOperators(unittest.TestCase):
     """col() proxy covers all operators and methods correctly."""
 
-    def test_eq(self):
-        from PowerPlatform.Dataverse.models.filters import col
-
-        self.assertEqual((col("name") == "Contoso").to_odata(), "name eq 'Contoso'")
-
-    def test_ne(self):
-        from PowerPlatform.Dataverse.models.filters import col
-
-        self.assertEqual((col("statecode") != 1).to_odata(), "statecode ne 1")
-
-    def test_gt(self):
-        from PowerPlatform.Dataverse.models.filters import col
-
-        self.assertEqual((col("revenue") > 1000000).to_odata(), "revenue gt 1000000")
-
-    def test_ge(self):
-        from PowerPlatform.Dataverse.models.filters import col
-
-        self.assertEqual((col("revenue") >= 1000000).to_odata(), "revenue ge 1000000")
-
-    def test_lt(self):
-        from PowerPlatform.Dataverse.models.filters import col
-
-        self.assertEqual((col("revenue") < 500000).to_odata(), "revenue lt 500000")
-
-    def test_le(self):
-        from PowerPlatform.Dataverse.models.filters import col
-
-        self.assertEqual((col("revenue") <= 500000).to_odata(), "revenue le 500000")
+    def test_comparison_operators(self):
+        """Each comparison dunder maps to its OData operator, with literals formatted by type."""
+        from PowerPlatform.Dataverse.models.filters import col
+
+        # Calling the operator functions directly keeps ColumnProxy on the left and
+        # avoids the ``== None`` / ``== True`` spellings flake8 would flag.
+        cases = [
+            (operator.eq, "name", "Contoso", "name eq 'Contoso'"),
+            (operator.ne, "statecode", 1, "statecode ne 1"),
+            (operator.gt, "revenue", 1000000, "revenue gt 1000000"),
+            (operator.ge, "revenue", 1000000, "revenue ge 1000000"),
+            (operator.lt, "revenue", 500000, "revenue lt 500000"),
+            (operator.le, "revenue", 500000, "revenue le 500000"),
+            (operator.eq, "active", True, "active eq true"),
+            (operator.eq, "active", False, "active eq false"),
+            (operator.eq, "telephone1", None, "telephone1 eq null"),
+        ]
+        for op, column, value, expected in cases:
+            with self.subTest(op=op.__name__, value=value):
+                self.assertEqual(op(col(column), value).to_odata(), expected)
 
     def test_is_null(self):
         from PowerPlatform.Dataverse.models.filters import col
@@ -766,17 +758,6 @@ class TestColumnProxyOperators(unittest.TestCase):
         with self.assertRaises(ValueError):
             col("   ")
 
-    def test_boolean_eq(self):
-        from PowerPlatform.Dataverse.models.filters import col
-
-        self.assertEqual((col("active") == True).to_odata(), "active eq true")  # noqa: E712
-        self.assertEqual((col("active") == False).to_odata(), "active eq false")  # noqa: E712
-
-    def test_none_eq(self):
-        from PowerPlatform.Dataverse.models.filters import col
-
-        self.assertEqual((col("telephone1") == None).to_odata(), "telephone1 eq null")  # noqa: E711
-
     def test_and_composition(self):
         from PowerPlatform.Dataverse.models.filters import col
 
@@ -20,6 +20,14 @@ from azure.core.credentials import TokenCredential
 from PowerPlatform.Dataverse.models.record import QueryResult, Record
 from PowerPlatform.Dataverse.models.query_builder import QueryBuilder
 
+# Shared, read-only sample records; QueryResult never mutates the Records it wraps.
+_SAMPLE_RECORDS = tuple(Record(id=f"id-{i}", table="account", data={"name": f"R{i}"}) for i in range(7))
+
+
+def _records(n=3):
+    """Return a fresh list holding the first *n* shared sample records."""
+    return list(_SAMPLE_RECORDS[:n])
+
 
 def _make_client():
     cred = MagicMock(spec=TokenCredential)
@@ -35,13 +43,10 @@ def _make_client():
 class TestQueryResultClass(unittest.TestCase):
     """Unit tests for QueryResult."""
 
-    def _records(self, n=3):
-        return [Record(id=f"id-{i}", table="account", data={"name": f"R{i}"}) for i in range(n)]
-
     # ----- construction / dunder
 
     def test_init_stores_records(self):
-        recs = self._records(2)
+        recs = _records(2)
         qr = QueryResult(recs)
         self.assertIs(qr.records, recs)
 
@@ -51,33 +56,29 @@ class TestQueryResultClass(unittest.TestCase):
         self.assertFalse(bool(qr))
         self.assertIsNone(qr.first())
 
-    def test_len(self):
-        self.assertEqual(len(QueryResult(self._records(5))), 5)
-
-    def test_bool_true_when_nonempty(self):
-        self.assertTrue(bool(QueryResult(self._records(1))))
-
-    def test_bool_false_when_empty(self):
-        self.assertFalse(bool(QueryResult([])))
+    def test_len_and_bool(self):
+        for n in (0, 1, 5):
+            with self.subTest(n=n):
+                qr = QueryResult(_records(n))
+                self.assertEqual(len(qr), n)
+                self.assertIs(bool(qr), n > 0)
 
     def test_iter_yields_records(self):
-        recs = self._records(3)
-        qr = QueryResult(recs)
-        self.assertEqual(list(qr), recs)
+        qr = QueryResult(_records(3))
+        self.assertEqual(tuple(qr), _SAMPLE_RECORDS[:3])
 
     def test_iter_multiple_times(self):
-        recs = self._records(2)
-        qr = QueryResult(recs)
-        self.assertEqual(list(qr), list(qr))
+        qr = QueryResult(_records(2))
+        self.assertEqual(tuple(qr), tuple(qr))
 
     def test_repr_contains_count(self):
-        qr = QueryResult(self._records(7))
+        qr = QueryResult(_records(7))
         self.assertIn("7", repr(qr))
 
     # ----- first()
 
     def test_first_returns_first_record(self):
-        recs = self._records(3)
+        recs = _records(3)
         qr = QueryResult(recs)
         self.assertIs(qr.first(), recs[0])
 
@@ -87,30 +88,30 @@ class TestQueryResultClass(unittest.TestCase):
     # ----- __getitem__
 
     def test_getitem_int_returns_record(self):
-        recs = self._records(3)
+        recs = _records(3)
         qr = QueryResult(recs)
         self.assertIs(qr[0], recs[0])
         self.assertIs(qr[2], recs[2])
 
     def test_getitem_negative_index(self):
-        recs = self._records(3)
+        recs = _records(3)
         qr = QueryResult(recs)
         self.assertIs(qr[-1], recs[-1])
 
     def test_getitem_out_of_range_raises(self):
-        qr = QueryResult(self._records(2))
+        qr = QueryResult(_records(2))
         with self.assertRaises(IndexError):
             _ = qr[99]
 
     def test_getitem_slice_returns_query_result(self):
-        recs = self._records(5)
+        recs = _records(5)
         qr = QueryResult(recs)
         sliced = qr[1:3]
         self.assertIsInstance(sliced, QueryResult)
         self.assertEqual(list(sliced), recs[1:3])
 
     def test_getitem_slice_empty(self):
-        qr = QueryResult(self._records(3))
+        qr = QueryResult(_records(3))
         sliced = qr[10:]
         self.assertIsInstance(sliced, QueryResult)
         self.assertEqual(len(sliced), 0)
@@ -152,7 +153,7 @@ class TestQueryResultClass(unittest.TestCase):
     # ----- for r in result (backward compat)
 
     def test_backward_compat_for_loop(self):
-        recs = self._records(3)
+        recs = _records(3)
         qr = QueryResult(recs)
         collected = []
         for r in qr:
@@ -160,7 +161,7 @@ class TestQueryResultClass(unittest.TestCase):
         self.assertEqual(collected, recs)
 
     def test_list_conversion(self):
-        recs = self._records(4)
+        recs = _records(4)
         qr = QueryResult(recs)
         self.assertEqual(list(qr), recs)
 
@@ -176,25 +177,22 @@ class TestQueryResultListLikeContract(unittest.TestCase):
     breaks at least one assertion here with a clear signal.
     """
 
-    def _records(self, n=3):
-        return [Record(id=f"id-{i}", table="account", data={"name": f"R{i}"}) for i in range(n)]
-
     def test_contract_index_then_field_access(self):
         """Pattern from examples/advanced/fetchxml.py: ``row = result[0]; row.get(...)``."""
-        qr = QueryResult(self._records(3))
+        qr = QueryResult(_records(3))
         row = qr[0]
         self.assertEqual(row.get("name"), "R0")
 
     def test_contract_single_loop_field_access(self):
         """Pattern from examples/basic/installation_example.py: ``for r in result: r["name"]``."""
-        qr = QueryResult(self._records(3))
+        qr = QueryResult(_records(3))
         names = [r["name"] for r in qr]
         self.assertEqual(names, ["R0", "R1", "R2"])
 
     def test_contract_first_with_none_guard(self):
         """Pattern recommended by Copilot review: ``result.first()`` with None-check."""
         empty = QueryResult([])
-        nonempty = QueryResult(self._records(2))
+        nonempty = QueryResult(_records(2))
         self.assertIsNone(empty.first())
         first = nonempty.first()
         self.assertIsNotNone(first)
@@ -202,7 +200,7 @@ class TestQueryResultListLikeContract(unittest.TestCase):
 
     def test_contract_truthy_guard(self):
         """Pattern: ``if result: ...`` to skip empty results before indexing."""
-        if QueryResult(self._records(1)):
+        if QueryResult(_records(1)):
             ok = True
         else:
             ok = False
@@ -211,24 +209,24 @@ class TestQueryResultListLikeContract(unittest.TestCase):
 
     def test_contract_len_for_size_check(self):
         """Pattern: ``f"{len(result)} rows"`` in log/print statements."""
-        self.assertEqual(len(QueryResult(self._records(7))), 7)
+        self.assertEqual(len(QueryResult(_records(7))), 7)
         self.assertEqual(len(QueryResult([])), 0)
 
     def test_contract_slice_returns_list_like(self):
         """Slicing must yield something that supports iteration and len()."""
-        qr = QueryResult(self._records(5))
+        qr = QueryResult(_records(5))
         page = qr[1:4]
         self.assertEqual(len(page), 3)
         self.assertEqual([r.get("name") for r in page], ["R1", "R2", "R3"])
 
     def test_contract_negative_index(self):
         """``result[-1]`` for "last record" is a common Python idiom."""
-        qr = QueryResult(self._records(3))
+        qr = QueryResult(_records(3))
         self.assertEqual(qr[-1].get("name"), "R2")
 
     def test_contract_list_conversion_round_trip(self):
         """``list(result)`` must yield the same records iteration yields."""
-        recs = self._records(4)
+        recs = _records(4)
         qr = QueryResult(recs)
         self.assertEqual(list(qr), recs)
         self.assertEqual(list(qr), [r for r in qr])
@@ -238,9 +236,9 @@ class TestQueryResultListLikeContract(unittest.TestCase):
 
         Guards against an accidental refactor to a single-shot iterator.
         """
-        qr = QueryResult(self._records(3))
-        first_pass = list(qr)
-        second_pass = list(qr)
+        qr = QueryResult(_records(3))
+        first_pass = tuple(qr)
+        second_pass = tuple(qr)
         self.assertEqual(first_pass, second_pass)
         self.assertEqual(len(first_pass), 3)
 
@@ -252,13 +250,13 @@ class TestQueryResultListLikeContract(unittest.TestCase):
         iterable over its keys). This test makes it explicit that the outer
         loop yields Records, not pages — so callers know to use a single loop.
         """
-        qr = QueryResult(self._records(2))
+        qr = QueryResult(_records(2))
         outer = list(qr)
         self.assertTrue(all(isinstance(r, Record) for r in outer))
 
     def test_contract_records_attribute_is_underlying_list(self):
         """``result.records`` is the documented escape hatch for list-only APIs."""
-        recs = self._records(3)
+        recs = _records(3)
         qr = QueryResult(recs)
         self.assertIsInstance(qr.records, list)
         self.assertIs(qr.records, recs)